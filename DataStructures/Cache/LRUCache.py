@@ -0,0 +1,205 @@
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+for _directory in ("HashMap", "LinkedList"):
+    _directory = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", _directory))
+    if _directory not in sys.path:
+        sys.path.append(_directory)
+
+from HashMap import HashMap
+from DoublyLinkedList import DoublyLinkedList, Node
+
+_MISSING = object()
+
+
+class CacheEntry:
+    """
+    The payload of a recency-list node.
+
+    Attributes:
+        key: The cache key, kept so an evicted node can be removed from the map.
+        value: The cached value.
+        weight: The cost of the entry counted against ``max_weight``.
+        expires_at: The clock time after which the entry is stale, or None.
+    """
+
+    __slots__ = ("key", "value", "weight", "expires_at")
+
+    def __init__(self, key: Hashable, value: Any, weight: int, expires_at: Optional[float]) -> None:
+        self.key: Hashable = key
+        self.value: Any = value
+        self.weight: int = weight
+        self.expires_at: Optional[float] = expires_at
+
+
+class LRUCache:
+    """
+    A bounded cache with least-recently-used eviction and optional per-entry expiry.
+
+    A ``HashMap`` maps each key to its node in a ``DoublyLinkedList`` that is kept in
+    recency order: the head is the least recently used entry and the tail the most
+    recent one. Lookups, insertions and evictions are all O(1).
+    """
+
+    def __init__(self, max_size: Optional[int] = None, max_weight: Optional[int] = None,
+                 weigher: Optional[Callable[[Hashable, Any], int]] = None,
+                 ttl: Optional[float] = None,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (Optional[int]): Maximum number of entries, or None for no limit.
+            max_weight (Optional[int]): Maximum total weight of all entries, or None for no limit.
+            weigher (Optional[Callable]): Returns the weight of a (key, value) pair. Defaults to 1 per entry.
+            ttl (Optional[float]): Default lifetime of an entry in seconds, or None to never expire.
+            on_evict (Optional[Callable]): Called with (key, value) when an entry is evicted or expires.
+            clock (Callable[[], float]): Time source used for expiry.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if max_weight is not None and max_weight < 1:
+            raise ValueError("max_weight must be at least 1")
+        self.max_size = max_size
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.clock = clock
+        self.weight: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self._map = HashMap()
+        self._order = DoublyLinkedList()
+
+    def __len__(self) -> int:
+        return self._order.size()
+
+    def __contains__(self, key: Hashable) -> bool:
+        node = self._map.get(key)
+        return node is not None and not self._expired(node.data)
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self.clock()
+
+    def _discard(self, node: Node) -> CacheEntry:
+        """
+        Removes a node from both the recency list and the map.
+        """
+        entry = self._order.unlink(node).data
+        self._map.delete(entry.key)
+        self.weight -= entry.weight
+        return entry
+
+    def _evict(self, node: Node, expired: bool) -> None:
+        """
+        Discards a node and reports it through the counters and the eviction callback.
+        """
+        entry = self._discard(node)
+        if expired:
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    def _over_limit(self) -> bool:
+        return ((self.max_size is not None and self._order.size() > self.max_size) or
+                (self.max_weight is not None and self.weight > self.max_weight))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key and marks it as most recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned on a miss.
+
+        Returns:
+            Any: The cached value, or ``default`` if the key is absent or expired.
+        """
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node.data):
+            self._evict(node, expired=True)
+            self.misses += 1
+            return default
+        self._order.move_to_end(node)
+        self.hits += 1
+        return node.data.value
+
+    def put(self, key: Hashable, value: Any, ttl: Any = _MISSING) -> None:
+        """
+        Stores a value, replacing any previous one, and evicts least recently used
+        entries until the cache is back within its limits.
+
+        Args:
+            key (Hashable): The key to store.
+            value (Any): The value to cache.
+            ttl (Optional[float]): Lifetime of this entry in seconds, overriding the cache default.
+                Pass None to make this entry never expire.
+        """
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if self.max_weight is not None and weight > self.max_weight:
+            raise ValueError(f"Entry weight {weight} exceeds max_weight {self.max_weight}.")
+
+        node = self._map.get(key)
+        if node is not None:
+            entry = node.data
+            self.weight += weight - entry.weight
+            entry.value, entry.weight, entry.expires_at = value, weight, expires_at
+            self._order.move_to_end(node)
+        else:
+            node = self._order.insert_end(CacheEntry(key, value, weight, expires_at))
+            self._map.add(key, node)
+            self.weight += weight
+
+        while self._over_limit():
+            self._evict(self._order.head, expired=False)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Removes a key from the cache without calling the eviction callback.
+
+        Returns:
+            bool: True if the key was present, False otherwise.
+        """
+        node = self._map.get(key)
+        if node is None:
+            return False
+        self._discard(node)
+        return True
+
+    def expire(self) -> int:
+        """
+        Removes every expired entry.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        stale = [node for node in self._order if self._expired(node.data)]
+        for node in stale:
+            self._evict(node, expired=True)
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit, miss, eviction and expiration counters along with the current size and weight.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self),
+            "weight": self.weight,
+        }
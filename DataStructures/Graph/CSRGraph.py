@@ -0,0 +1,219 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up building from an edge array.
+    np = None
+
+from Graph import UnweightedGraph, WeightedGraph
+
+_MAGIC = b"CSRGRAPH"
+# magic, flags, number of vertices, number of edges; the offset, target and weight arrays follow
+_HEADER = struct.Struct("<8sQQQ")
+_DIRECTED, _WEIGHTED = 1, 2
+
+
+class CSRGraph:
+    """
+    Represents a frozen graph in compressed sparse row (CSR) form.
+
+    The destinations of every vertex are stored next to each other in one flat array,
+    ``targets``, and the out-edges of vertex ``v`` are
+    ``targets[offsets[v]:offsets[v + 1]]``. For a weighted graph, ``weights`` runs
+    parallel to ``targets``. Every edge costs 8 bytes, plus 8 for its weight, compared
+    with a list slot, an int and a tuple per edge in the adjacency lists. Each row is
+    sorted by destination, so ``has_edge`` is a binary search within that row.
+
+    Attributes:
+        vertices (int): The number of vertices in the graph.
+        directed (bool): Whether the graph is directed. An undirected graph stores every edge in both directions.
+        offsets (array): ``vertices + 1`` row boundaries into ``targets``.
+        targets (array): The destination of every edge, grouped by source.
+        weights (Optional[array]): The weight of every edge, or None for an unweighted graph.
+
+    A graph opened with ``load`` holds memoryviews of a memory-mapped file instead of
+    arrays, so any number of processes can share one copy through the page cache.
+    """
+
+    def __init__(self, vertices: int, offsets: array, targets: array,
+                 weights: Optional[array] = None, directed: bool = True) -> None:
+        self.vertices: int = vertices
+        self.directed: bool = directed
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: Optional[array] = weights
+
+    @classmethod
+    def from_graph(cls, graph: Union[UnweightedGraph, WeightedGraph]) -> "CSRGraph":
+        """
+        Freezes an ``UnweightedGraph`` or a ``WeightedGraph`` in a single pass over its adjacency lists.
+        """
+        rows = [sorted(row) for row in graph.edges]
+        offsets = array("q", accumulate((len(row) for row in rows), initial=0))
+        if isinstance(graph, WeightedGraph):
+            targets = array("q", (dest for row in rows for dest, _ in row))
+            weights = array("d", (weight for row in rows for _, weight in row))
+        else:
+            targets = array("q", (dest for row in rows for dest in row))
+            weights = None
+        return cls(graph.vertices, offsets, targets, weights, graph.directed)
+
+    @classmethod
+    def from_edges(cls, vertices: int, edges: Union[Sequence[Tuple], "np.ndarray"],
+                   directed: bool = True) -> "CSRGraph":
+        """
+        Builds the graph straight from an edge array, without going through adjacency lists.
+
+        Duplicate edges are kept. With NumPy the edges are grouped by a single stable
+        sort. Without it, a counting sort makes one pass to size the rows and one to
+        fill them.
+
+        Args:
+            vertices (int): The number of vertices.
+            edges: An (m, 2) or (m, 3) array, or a sequence of (start, dest) or
+                (start, dest, weight) tuples. A third column makes the graph weighted.
+            directed (bool): If False, every edge is also stored in the reverse direction.
+
+        Raises:
+            ValueError: If an edge refers to a vertex outside the graph.
+        """
+        if np is not None:
+            return cls._from_edges_numpy(vertices, np.asarray(edges), directed)
+
+        edges = list(edges)
+        weighted = bool(edges) and len(edges[0]) == 3
+        if not directed:
+            edges += [(dest, start, *rest) for start, dest, *rest in edges]
+        counts = [0] * (vertices + 1)
+        for edge in edges:
+            start, dest = edge[0], edge[1]
+            if not (0 <= start < vertices and 0 <= dest < vertices):
+                raise ValueError(f"Edge ({start}, {dest}) refers to a vertex outside the graph")
+            counts[start + 1] += 1
+        offsets = array("q", accumulate(counts))
+        cursor = list(offsets[:-1])
+        slots = [None] * len(edges)
+        for edge in edges:
+            start = edge[0]
+            slots[cursor[start]] = edge[1:]
+            cursor[start] += 1
+        for vertex in range(vertices):
+            lo, hi = offsets[vertex], offsets[vertex + 1]
+            if hi - lo > 1:
+                slots[lo:hi] = sorted(slots[lo:hi])
+        targets = array("q", (slot[0] for slot in slots))
+        weights = array("d", (slot[1] for slot in slots)) if weighted else None
+        return cls(vertices, offsets, targets, weights, directed)
+
+    @classmethod
+    def _from_edges_numpy(cls, vertices: int, edges: "np.ndarray", directed: bool) -> "CSRGraph":
+        if edges.size == 0:
+            edges = edges.reshape(0, 2)
+        starts = edges[:, 0].astype(np.int64)
+        dests = edges[:, 1].astype(np.int64)
+        weights = edges[:, 2].astype(np.float64) if edges.shape[1] == 3 else None
+        if not directed:
+            starts, dests = np.concatenate((starts, dests)), np.concatenate((dests, starts))
+            if weights is not None:
+                weights = np.concatenate((weights, weights))
+        if len(starts) and (min(starts.min(), dests.min()) < 0 or max(starts.max(), dests.max()) >= vertices):
+            raise ValueError("An edge refers to a vertex outside the graph")
+        order = np.lexsort((dests, starts) if weights is None else (weights, dests, starts))
+        offsets = np.zeros(vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(starts, minlength=vertices), out=offsets[1:])
+        return cls(
+            vertices,
+            array("q", offsets.tobytes()),
+            array("q", dests[order].tobytes()),
+            array("d", weights[order].tobytes()) if weights is not None else None,
+            directed,
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Writes the graph to a file that ``load`` can memory-map.
+        """
+        flags = (_DIRECTED if self.directed else 0) | (_WEIGHTED if self.weights is not None else 0)
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, flags, self.vertices, len(self.targets)))
+            file.write(self.offsets)
+            file.write(self.targets)
+            if self.weights is not None:
+                file.write(self.weights)
+
+    @classmethod
+    def load(cls, path: str) -> "CSRGraph":
+        """
+        Memory-maps a file written by ``save``, read-only.
+
+        Nothing is copied: pages are read on first access and shared with every other
+        process that maps the same file.
+
+        Raises:
+            ValueError: If the file is not a CSR graph file.
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapping)
+        magic, flags, vertices, edges = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a CSR graph file.")
+        start = _HEADER.size
+        offsets = view[start:start + 8 * (vertices + 1)].cast("q")
+        start += 8 * (vertices + 1)
+        targets = view[start:start + 8 * edges].cast("q")
+        start += 8 * edges
+        weights = view[start:start + 8 * edges].cast("d") if flags & _WEIGHTED else None
+        return cls(vertices, offsets, targets, weights, bool(flags & _DIRECTED))
+
+    def __str__(self) -> str:
+        output: str = ""
+        for i in range(self.vertices):
+            if self.weights is None:
+                output += f"{i}: " + " ".join(str(dest) for dest in self.neighbors(i)) + "\n"
+            else:
+                output += f"{i}: " + " ".join(f"{dest} (weight: {weight})" for dest, weight in self.edges_from(i)) + "\n"
+        return output
+
+    def edge_count(self) -> int:
+        """Returns the number of stored edges; an undirected edge counts twice."""
+        return len(self.targets)
+
+    def has_vertex(self, vertex: int) -> bool:
+        """Checks if a vertex exists in the graph."""
+        return 0 <= vertex < self.vertices
+
+    def has_edge(self, start: int, dest: int) -> bool:
+        """Checks if an edge exists between two vertices, in O(log degree)."""
+        if not (self.has_vertex(start) and self.has_vertex(dest)):
+            return False
+        hi = self.offsets[start + 1]
+        index = bisect_left(self.targets, dest, self.offsets[start], hi)
+        return index < hi and self.targets[index] == dest
+
+    def out_degree(self, vertex: int) -> int:
+        """Returns the number of edges leaving a vertex."""
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def neighbors(self, vertex: int) -> array:
+        """Returns the destinations of the edges leaving a vertex, in ascending order."""
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def edges_from(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """Iterates over the (destination, weight) pairs of the edges leaving a vertex; unweighted edges weigh 1.0."""
+        lo, hi = self.offsets[vertex], self.offsets[vertex + 1]
+        if self.weights is None:
+            return ((dest, 1.0) for dest in self.targets[lo:hi])
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def nbytes(self) -> int:
+        """Returns the number of bytes used by the offset, target and weight arrays."""
+        size = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            size += self.weights.itemsize * len(self.weights)
+        return size
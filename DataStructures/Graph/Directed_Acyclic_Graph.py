@@ -1,19 +1,62 @@
-from typing import List, Tuple
-import networkx as nx
-from matplotlib import pyplot as plt
+from collections import deque
+from typing import Dict, Generator, Hashable, Iterable, List, Optional, Set, Tuple
 
 
 class DAG:
     """
-    A class representing a Directed Acyclic Graph (DAG) using the networkx library.
+    A class representing a Directed Acyclic Graph (DAG).
     It allows adding edges, verifying the acyclic property, and visualizing the graph.
+
+    The graph is stored in plain dictionaries of successors and predecessors, so the
+    core needs no third-party packages. networkx and matplotlib are imported only by
+    ``to_networkx`` and ``visualize``.
+
+    A topological order of the nodes is maintained as edges arrive (the dynamic
+    topological sort of Pearce and Kelly). An edge that already agrees with the order
+    is accepted in O(1). Any other edge searches only the nodes whose positions lie
+    between its endpoints: it either finds the cycle it would close, or reorders just
+    those nodes.
     """
 
     def __init__(self):
         """
         Initializes a new instance of the DAG class with an empty directed graph.
         """
-        self.graph = nx.DiGraph()
+        # Dicts with None values are used as insertion-ordered sets.
+        self.successors: Dict[Hashable, Dict[Hashable, None]] = {}
+        self.predecessors: Dict[Hashable, Dict[Hashable, None]] = {}
+        self.order: List[Hashable] = []
+        self.position: Dict[Hashable, int] = {}
+        self._frozen = None  # The networkx view behind ``graph``, rebuilt after the next change.
+
+    def _add_node(self, node: Hashable) -> None:
+        if node not in self.position:
+            self.successors[node] = {}
+            self.predecessors[node] = {}
+            self.position[node] = len(self.order)
+            self.order.append(node)
+
+    def _affected(self, start: Hashable, bound: int, forward: bool, stop: Hashable) -> Optional[Set[Hashable]]:
+        """
+        Collects the nodes reachable from ``start`` (forwards or backwards) whose positions
+        lie strictly on ``start``'s side of ``bound``.
+
+        Returns:
+            Optional[Set[Hashable]]: The nodes found, or None if ``stop`` is reachable,
+            which means the new edge would close a cycle.
+        """
+        neighbors = self.successors if forward else self.predecessors
+        position = self.position
+        visited = {start}
+        stack = [start]
+        while stack:
+            for node in neighbors[stack.pop()]:
+                if node == stop:
+                    return None
+                if node not in visited and (position[node] < bound if forward else position[node] > bound):
+                    visited.add(node)
+                    stack.append(node)
+        return visited
 
     def add_edge(self, edge: Tuple[str, str]) -> None:
         """
@@ -23,30 +66,217 @@ class DAG:
             edge (Tuple[str, str]): The edge to add, represented as a tuple of two strings (source, target).
 
         Raises:
-            Exception: If adding the edge would make the graph cyclic.
+            ValueError: If adding the edge would make the graph cyclic.
         """
-        self.graph.add_edge(*edge)  # Unpack the edge tuple
-        if not nx.is_directed_acyclic_graph(self.graph):
-            self.graph.remove_edge(*edge)  # Correctly remove the edge if it creates a cycle
-            raise Exception(f"Unable to insert {edge}. The graph must remain acyclic.")
+        source, target = edge
+        self._frozen = None
+        self._add_node(source)
+        self._add_node(target)
+        if self.has_edge(source, target):
+            return
+        lower, upper = self.position[target], self.position[source]
+        if lower <= upper:
+            forward = self._affected(target, upper, True, source) if source != target else None
+            if forward is None:
+                raise ValueError(f"Unable to insert {edge}. The graph must remain acyclic.")
+            backward = self._affected(source, lower, False, target)
+            # Move the nodes that reach the source ahead of the ones the target reaches,
+            # reusing the same positions.
+            nodes = sorted(backward, key=self.position.__getitem__) + sorted(forward, key=self.position.__getitem__)
+            slots = sorted(self.position[node] for node in nodes)
+            for node, slot in zip(nodes, slots):
+                self.position[node] = slot
+                self.order[slot] = node
+        self._link(source, target)
 
-    def add_edges(self, edges: List[Tuple[str, str]]) -> None:
+    def _link(self, source: Hashable, target: Hashable) -> None:
+        self.successors[source][target] = None
+        self.predecessors[target][source] = None
+
+    def _unlink(self, source: Hashable, target: Hashable) -> None:
+        del self.successors[source][target]
+        del self.predecessors[target][source]
+
+    def add_edges(self, edges: Iterable[Tuple[str, str]]) -> None:
         """
         Adds a list of edges to the DAG and checks if the graph remains acyclic.
 
+        The whole batch is inserted first and then validated by a single topological
+        sort, in O(V + E) instead of one check per edge. The batch is atomic: if it would
+        create a cycle, none of its edges are kept.
+
         Args:
-            edges (List[Tuple[str, str]]): A list of edges to add, each represented as a tuple of two strings (source, target).
+            edges (Iterable[Tuple[str, str]]): The edges to add, each represented as a tuple of two strings (source, target).
 
         Raises:
-            Exception: If adding any edge in the list would make the graph cyclic.
+            ValueError: If adding the edges would make the graph cyclic. The message
+                names the nodes on the cycles rather than the whole batch.
+        """
+        edges = list(edges)
+        self._frozen = None
+        added = []
+        for source, target in dict.fromkeys(edges):
+            self._add_node(source)
+            self._add_node(target)
+            if not self.has_edge(source, target):
+                self._link(source, target)
+                added.append((source, target))
+        order = self._topological_sort()
+        if len(order) < len(self.order):
+            cyclic = self._on_cycles(set(self.order).difference(order))
+            for source, target in added:
+                self._unlink(source, target)
+            shown = ", ".join(map(repr, cyclic[:10])) + (f" and {len(cyclic) - 10} more" if len(cyclic) > 10 else "")
+            raise ValueError(f"Unable to insert a batch of {len(edges)} edges: it would close a cycle through "
+                             f"{shown}. The graph must remain acyclic.")
+        self.order = order
+        self.position = {node: index for index, node in enumerate(order)}
+
+    def _topological_sort(self) -> List[Hashable]:
+        """
+        Sorts the nodes with Kahn's algorithm, seeded in the current order so the
+        result is deterministic.
+
+        Returns:
+            List[Hashable]: The nodes in topological order. If the graph has a cycle, the
+            nodes on it and every node it reaches are missing.
+        """
+        in_degree = {node: len(self.predecessors[node]) for node in self.order}
+        ready = deque(node for node in self.order if in_degree[node] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor in self.successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
+        return order
+
+    def _on_cycles(self, leftover: Set[Hashable]) -> List[Hashable]:
+        """
+        Narrows the nodes a topological sort left over to those on a cycle, or on a path
+        between two cycles, by peeling off nodes without a successor among them.
+
+        Returns:
+            List[Hashable]: The remaining nodes, in the DAG's insertion order.
+        """
+        out_degree = {node: sum(successor in leftover for successor in self.successors[node]) for node in leftover}
+        sinks = [node for node, degree in out_degree.items() if degree == 0]
+        while sinks:
+            node = sinks.pop()
+            leftover.discard(node)
+            for predecessor in self.predecessors[node]:
+                if predecessor in leftover:
+                    out_degree[predecessor] -= 1
+                    if out_degree[predecessor] == 0:
+                        sinks.append(predecessor)
+        return [node for node in self.order if node in leftover]
+
+    def topological_order(self) -> List[Hashable]:
+        """
+        Returns the maintained topological order in O(1): every edge points from an
+        earlier node to a later one.
+
+        The list is the DAG's own and must not be modified.
+        """
+        return self.order
+
+    def has_edge(self, source: Hashable, target: Hashable) -> bool:
+        """
+        Checks if the edge (source, target) is in the DAG.
+        """
+        return source in self.successors and target in self.successors[source]
+
+    def edges(self) -> Generator[Tuple[Hashable, Hashable], None, None]:
+        """
+        Iterates over the edges as (source, target) tuples.
+        """
+        for source, targets in self.successors.items():
+            for target in targets:
+                yield source, target
+
+    def _reachable(self, start: Hashable, forward: bool, target: Optional[Hashable] = None) -> Set[Hashable]:
+        neighbors = self.successors if forward else self.predecessors
+        position = self.position
+        bound = position[target] if target is not None else None
+        visited = {start}
+        stack = [start]
+        while stack:
+            for node in neighbors[stack.pop()]:
+                if node in visited:
+                    continue
+                # A path to the target only passes through nodes ordered before it.
+                if bound is not None and position[node] > bound:
+                    continue
+                visited.add(node)
+                if node == target:
+                    return visited
+                stack.append(node)
+        return visited
+
+    def has_path(self, source: Hashable, target: Hashable) -> bool:
+        """
+        Checks if ``target`` can be reached from ``source`` along the edges.
+
+        The search skips every node that comes after ``target`` in the topological
+        order, and returns at once if ``source`` itself comes after it.
         """
-        for edge in edges:
-            self.add_edge(edge)  # Reuse the add_edge method to ensure acyclic property for each edge
+        if source not in self.position or target not in self.position:
+            return False
+        if source == target:
+            return True
+        if self.position[source] > self.position[target]:
+            return False
+        return target in self._reachable(source, True, target)
+
+    def descendants(self, node: Hashable) -> Set[Hashable]:
+        """
+        Returns the nodes reachable from ``node``, excluding the node itself.
+        """
+        reachable = self._reachable(node, True)
+        reachable.discard(node)
+        return reachable
+
+    def ancestors(self, node: Hashable) -> Set[Hashable]:
+        """
+        Returns the nodes from which ``node`` is reachable, excluding the node itself.
+        """
+        reachable = self._reachable(node, False)
+        reachable.discard(node)
+        return reachable
+
+    def to_networkx(self):
+        """
+        Exports the DAG as a ``networkx.DiGraph``. networkx is imported on first use.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.order)
+        graph.add_edges_from(self.edges())
+        return graph
+
+    @property
+    def graph(self):
+        """
+        The DAG as a frozen ``networkx.DiGraph``, for code written against the old ``graph`` attribute.
+
+        It is built on first access and reused until the next ``add_edge`` or ``add_edges``.
+        Mutating it raises ``networkx.NetworkXError``; add edges through the DAG instead.
+        """
+        if self._frozen is None:
+            import networkx as nx
+
+            self._frozen = nx.freeze(self.to_networkx())
+        return self._frozen
 
     def visualize(self, location: str = "home") -> str:
         """
         Uses Matplotlib to visualize the DAG and saves the graph to a PNG file.
 
+        networkx and Matplotlib are imported here, not when the module is imported.
+
         Args:
             location (str): The file path where the graph image will be saved. Defaults to "home".
 
@@ -56,23 +286,34 @@ class DAG:
         Raises:
             Exception: If there is no graph to visualize.
         """
-        if not self.graph:
+        if not self.order:
             raise Exception("There is no graph to visualize. Consider adding edges first.")
-        
+
+        import networkx as nx
+        from matplotlib import pyplot as plt
+
         plt.tight_layout()
-        nx.draw_networkx(self.graph, arrows=True, node_size=800)
+        nx.draw_networkx(self.to_networkx(), arrows=True, node_size=800)
         plt.savefig(location, format="PNG")
         plt.clf()  # Clear the figure to free up memory and prevent overlap if called again
         return "Graph generated at " + location
 
 
-# Example usage:
-graph = DAG()
+def main():
+    """
+    Example usage: builds a small DAG and saves a drawing of it to dag.png.
+    """
+    graph = DAG()
+
+    graph.add_edges([
+        ("root", "a"), ("a", "b"),
+        ("a", "e"), ("b", "c"),
+        ("b", "d"), ("d", "e")
+    ])
+    print(graph.topological_order())
+
+    graph.visualize("dag.png")
 
-graph.add_edges([
-    ("root", "a"), ("a", "b"),
-    ("a", "e"), ("b", "c"),
-    ("b", "d"), ("d", "e")
-])
 
-graph.visualize("dag.png")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 
 class UnweightedGraph:
@@ -9,12 +9,17 @@ class UnweightedGraph:
         vertices (int): The number of vertices in the graph.
         directed (bool): Indicates if the graph is directed. Defaults to True.
         edges (List[List[int]]): Adjacency list representing the graph's edges.
+        indexed (bool): If True, a set per vertex mirrors its adjacency list, making
+            ``has_edge`` and ``add_edge`` O(1) at the cost of extra memory.
+        edge_sets (Optional[List[Set[int]]]): The per-vertex sets of destinations, or None.
     """
 
-    def __init__(self, vertices: int, directed: bool = True) -> None:
+    def __init__(self, vertices: int, directed: bool = True, indexed: bool = False) -> None:
         self.vertices: int = vertices
         self.directed: bool = directed
         self.edges: List[List[int]] = [[] for _ in range(vertices)]
+        self.indexed: bool = indexed
+        self.edge_sets: Optional[List[Set[int]]] = [set() for _ in range(vertices)] if indexed else None
 
     def __str__(self) -> str:
         output: str = ""
@@ -28,17 +33,60 @@ class UnweightedGraph:
 
     def has_edge(self, start: int, dest: int) -> bool:
         """Checks if an edge exists between two vertices."""
-        return self.has_vertex(start) and self.has_vertex(dest) and dest in self.edges[start]
+        if not (self.has_vertex(start) and self.has_vertex(dest)):
+            return False
+        return dest in (self.edge_sets[start] if self.indexed else self.edges[start])
 
     def add_edge(self, start: int, dest: int) -> bool:
         """Adds an edge between two vertices."""
         if not self.has_edge(start, dest):
             self.edges[start].append(dest)
+            if self.indexed:
+                self.edge_sets[start].add(dest)
             if not self.directed:
                 self.edges[dest].append(start)
+                if self.indexed:
+                    self.edge_sets[dest].add(start)
             return True
         return False
 
+    def add_edges(self, edges: Iterable[Tuple[int, int]]) -> int:
+        """
+        Adds many edges at once, skipping the ones already present.
+
+        Duplicates are detected with a set per vertex, so each edge costs O(1) instead of
+        a scan of its row. An indexed graph uses its own sets; otherwise a temporary set
+        is built the first time a vertex is touched.
+
+        Returns:
+            int: The number of edges added.
+
+        Raises:
+            ValueError: If an edge refers to a vertex outside the graph.
+        """
+        rows, vertices, directed = self.edges, self.vertices, self.directed
+        indexed_sets = self.edge_sets
+        sets: Dict[int, Set[int]] = {}
+        added = 0
+        for start, dest in edges:
+            if not (0 <= start < vertices and 0 <= dest < vertices):
+                raise ValueError(f"Edge ({start}, {dest}) refers to a vertex outside the graph")
+            targets = indexed_sets[start] if indexed_sets is not None else sets.get(start)
+            if targets is None:
+                targets = sets[start] = set(rows[start])
+            if dest in targets:
+                continue
+            targets.add(dest)
+            rows[start].append(dest)
+            if not directed:
+                sources = indexed_sets[dest] if indexed_sets is not None else sets.get(dest)
+                if sources is None:
+                    sources = sets[dest] = set(rows[dest])
+                sources.add(start)
+                rows[dest].append(start)
+            added += 1
+        return added
+
 
 class WeightedGraph:
     """
@@ -48,12 +96,18 @@ class WeightedGraph:
         vertices (int): The number of vertices in the graph.
         directed (bool): Indicates if the graph is directed. Defaults to True.
         edges (List[List[Tuple[int, int]]]): Adjacency list representing the graph's edges.
+        indexed (bool): If True, a set per vertex mirrors its adjacency list, making
+            ``has_edge`` and ``add_edge`` O(1) at the cost of extra memory.
+        edge_sets (Optional[List[Set[Tuple[int, int]]]]): The per-vertex sets of
+            (destination, weight) tuples, or None.
     """
 
-    def __init__(self, vertices: int, directed: bool = True) -> None:
+    def __init__(self, vertices: int, directed: bool = True, indexed: bool = False) -> None:
         self.vertices: int = vertices
         self.directed: bool = directed
         self.edges: List[List[Tuple[int, int]]] = [[] for _ in range(vertices)]
+        self.indexed: bool = indexed
+        self.edge_sets: Optional[List[Set[Tuple[int, int]]]] = [set() for _ in range(vertices)] if indexed else None
 
     def __str__(self) -> str:
         output: str = ""
@@ -68,17 +122,60 @@ class WeightedGraph:
 
     def has_edge(self, start: int, dest: int, weight: int) -> bool:
         """Checks if a weighted edge exists between two vertices."""
-        return self.has_vertex(start) and self.has_vertex(dest) and (dest, weight) in self.edges[start]
+        if not (self.has_vertex(start) and self.has_vertex(dest)):
+            return False
+        return (dest, weight) in (self.edge_sets[start] if self.indexed else self.edges[start])
 
     def add_edge(self, start: int, dest: int, weight: int) -> bool:
         """Adds a weighted edge between two vertices."""
         if not self.has_edge(start, dest, weight):
             self.edges[start].append((dest, weight))
+            if self.indexed:
+                self.edge_sets[start].add((dest, weight))
             if not self.directed:
                 self.edges[dest].append((start, weight))
+                if self.indexed:
+                    self.edge_sets[dest].add((start, weight))
             return True
         return False
 
+    def add_edges(self, edges: Iterable[Tuple[int, int, int]]) -> int:
+        """
+        Adds many (start, dest, weight) edges at once, skipping the ones already present.
+
+        Duplicates are detected with a set per vertex, so each edge costs O(1) instead of
+        a scan of its row. An indexed graph uses its own sets; otherwise a temporary set
+        is built the first time a vertex is touched.
+
+        Returns:
+            int: The number of edges added.
+
+        Raises:
+            ValueError: If an edge refers to a vertex outside the graph.
+        """
+        rows, vertices, directed = self.edges, self.vertices, self.directed
+        indexed_sets = self.edge_sets
+        sets: Dict[int, Set[Tuple[int, int]]] = {}
+        added = 0
+        for start, dest, weight in edges:
+            if not (0 <= start < vertices and 0 <= dest < vertices):
+                raise ValueError(f"Edge ({start}, {dest}) refers to a vertex outside the graph")
+            targets = indexed_sets[start] if indexed_sets is not None else sets.get(start)
+            if targets is None:
+                targets = sets[start] = set(rows[start])
+            if (dest, weight) in targets:
+                continue
+            targets.add((dest, weight))
+            rows[start].append((dest, weight))
+            if not directed:
+                sources = indexed_sets[dest] if indexed_sets is not None else sets.get(dest)
+                if sources is None:
+                    sources = sets[dest] = set(rows[dest])
+                sources.add((start, weight))
+                rows[dest].append((start, weight))
+            added += 1
+        return added
+
 
 def main():
     """
@@ -0,0 +1,295 @@
+from collections import deque
+from heapq import heappop, heappush
+from typing import Callable, Generator, Iterable, List, Optional, Tuple, Union
+
+from CSRGraph import CSRGraph
+from Graph import UnweightedGraph, WeightedGraph
+
+AnyGraph = Union[UnweightedGraph, WeightedGraph, CSRGraph]
+INF = float("inf")
+NO_PARENT = -1
+
+
+def _successors(graph: AnyGraph) -> Callable[[int], Iterable[int]]:
+    """Returns a function listing the destinations of the edges leaving a vertex."""
+    if isinstance(graph, CSRGraph):
+        return graph.neighbors
+    if isinstance(graph, WeightedGraph):
+        rows = graph.edges
+        return lambda vertex: [dest for dest, _ in rows[vertex]]
+    return graph.edges.__getitem__
+
+
+def _weighted_successors(graph: AnyGraph) -> Callable[[int], Iterable[Tuple[int, float]]]:
+    """Returns a function listing the (destination, weight) pairs leaving a vertex; unweighted edges weigh 1."""
+    if isinstance(graph, CSRGraph):
+        return graph.edges_from
+    if isinstance(graph, WeightedGraph):
+        return graph.edges.__getitem__
+    rows = graph.edges
+    return lambda vertex: [(dest, 1) for dest in rows[vertex]]
+
+
+def _check_vertex(graph: AnyGraph, vertex: int) -> None:
+    if not graph.has_vertex(vertex):
+        raise ValueError(f"Vertex {vertex} is not in the graph")
+
+
+def reconstruct_path(parents: List[int], source: int, target: int) -> List[int]:
+    """
+    Follows parent pointers back from ``target`` and returns the path from ``source``.
+
+    Returns:
+        List[int]: The vertices from ``source`` to ``target``, or an empty list if
+        ``target`` was not reached.
+    """
+    if target != source and parents[target] == NO_PARENT:
+        return []
+    path = [target]
+    while target != source:
+        target = parents[target]
+        path.append(target)
+    path.reverse()
+    return path
+
+
+def bfs(graph: AnyGraph, source: int, parents: Optional[List[int]] = None) -> Generator[int, None, None]:
+    """
+    Yields the vertices reachable from ``source`` in breadth-first order.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        source (int): The vertex to start from.
+        parents (Optional[List[int]]): If given, a list of ``graph.vertices`` entries that
+            receives the BFS tree: the parent of each visited vertex, ``NO_PARENT`` elsewhere.
+            ``reconstruct_path`` turns it into fewest-edge paths.
+    """
+    _check_vertex(graph, source)
+    successors = _successors(graph)
+    if parents is None:
+        parents = [NO_PARENT] * graph.vertices
+    visited = [False] * graph.vertices
+    visited[source] = True
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
+        yield vertex
+        for dest in successors(vertex):
+            if not visited[dest]:
+                visited[dest] = True
+                parents[dest] = vertex
+                queue.append(dest)
+
+
+def dfs(graph: AnyGraph, source: int, parents: Optional[List[int]] = None) -> Generator[int, None, None]:
+    """
+    Yields the vertices reachable from ``source`` in depth-first preorder.
+
+    An explicit stack of neighbour iterators visits vertices in the same order as the
+    recursive version, without its recursion limit.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        source (int): The vertex to start from.
+        parents (Optional[List[int]]): If given, receives the DFS tree as in ``bfs``.
+    """
+    _check_vertex(graph, source)
+    successors = _successors(graph)
+    if parents is None:
+        parents = [NO_PARENT] * graph.vertices
+    visited = [False] * graph.vertices
+    visited[source] = True
+    yield source
+    stack = [(source, iter(successors(source)))]
+    while stack:
+        vertex, pending = stack[-1]
+        for dest in pending:
+            if not visited[dest]:
+                visited[dest] = True
+                parents[dest] = vertex
+                yield dest
+                stack.append((dest, iter(successors(dest))))
+                break
+        else:
+            stack.pop()
+
+
+def dijkstra(graph: AnyGraph, source: int, target: Optional[int] = None) -> Tuple[List[float], List[int]]:
+    """
+    Computes shortest distances from ``source`` with a binary heap, in O((V + E) log V).
+
+    Improved distances are pushed as new heap entries and stale ones are skipped when
+    popped, which is cheaper than a decrease-key. Edge weights must be non-negative.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        source (int): The vertex to start from.
+        target (Optional[int]): If given, the search stops as soon as the target's
+            distance is final. Vertices that were not settled by then may hold
+            upper bounds.
+
+    Returns:
+        Tuple[List[float], List[int]]: The distance to every vertex (``inf`` if not
+        reached) and the parent of every vertex on its shortest path (``NO_PARENT`` for
+        the source and unreached vertices).
+    """
+    _check_vertex(graph, source)
+    successors = _weighted_successors(graph)
+    dist = [INF] * graph.vertices
+    parents = [NO_PARENT] * graph.vertices
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, vertex = heappop(heap)
+        if d > dist[vertex]:
+            continue
+        if vertex == target:
+            break
+        for dest, weight in successors(vertex):
+            candidate = d + weight
+            if candidate < dist[dest]:
+                dist[dest] = candidate
+                parents[dest] = vertex
+                heappush(heap, (candidate, dest))
+    return dist, parents
+
+
+def shortest_path(graph: AnyGraph, source: int, target: int) -> Tuple[float, List[int]]:
+    """
+    Returns the length of the shortest path from ``source`` to ``target`` and the path itself.
+
+    Runs ``dijkstra`` with an early exit at the target. An unreachable target gives ``(inf, [])``.
+    """
+    _check_vertex(graph, target)
+    dist, parents = dijkstra(graph, source, target)
+    return dist[target], reconstruct_path(parents, source, target)
+
+
+def astar(graph: AnyGraph, source: int, target: int,
+          heuristic: Callable[[int], float]) -> Tuple[float, List[int]]:
+    """
+    Finds a shortest path with A* search.
+
+    Vertices are expanded in order of ``distance + heuristic(vertex)``. With an admissible
+    heuristic (one that never overestimates the remaining distance), the path is
+    shortest. With a consistent one, no vertex is expanded twice. A heuristic of
+    ``lambda vertex: 0`` reduces to Dijkstra.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        source (int): The vertex to start from.
+        target (int): The vertex to reach.
+        heuristic (Callable[[int], float]): An estimate of the distance from a vertex to ``target``.
+
+    Returns:
+        Tuple[float, List[int]]: The path length and the path, or ``(inf, [])`` if
+        ``target`` is unreachable.
+    """
+    _check_vertex(graph, source)
+    _check_vertex(graph, target)
+    successors = _weighted_successors(graph)
+    dist = [INF] * graph.vertices
+    parents = [NO_PARENT] * graph.vertices
+    dist[source] = 0
+    heap = [(heuristic(source), 0, source)]
+    while heap:
+        _, d, vertex = heappop(heap)
+        if d > dist[vertex]:
+            continue
+        if vertex == target:
+            return d, reconstruct_path(parents, source, target)
+        for dest, weight in successors(vertex):
+            candidate = d + weight
+            if candidate < dist[dest]:
+                dist[dest] = candidate
+                parents[dest] = vertex
+                heappush(heap, (candidate + heuristic(dest), candidate, dest))
+    return INF, []
+
+
+def reverse_adjacency(graph: AnyGraph) -> List[List[Tuple[int, float]]]:
+    """
+    Returns the (source, weight) pairs entering every vertex, for searching backwards.
+
+    Build it once and pass it to ``bidirectional_dijkstra`` to answer many queries on
+    the same directed graph.
+    """
+    successors = _weighted_successors(graph)
+    reverse: List[List[Tuple[int, float]]] = [[] for _ in range(graph.vertices)]
+    for vertex in range(graph.vertices):
+        for dest, weight in successors(vertex):
+            reverse[dest].append((vertex, weight))
+    return reverse
+
+
+def bidirectional_dijkstra(graph: AnyGraph, source: int, target: int,
+                           reverse: Optional[List[List[Tuple[int, float]]]] = None) -> Tuple[float, List[int]]:
+    """
+    Finds a shortest path by running Dijkstra forwards from ``source`` and backwards
+    from ``target`` in alternation.
+
+    The search stops once the smallest keys of the two heaps add up to at least the
+    best path found through an edge between the two searches. On road-like graphs
+    each side settles a ball of about half the radius, far fewer vertices than a
+    one-sided search.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        source (int): The vertex to start from.
+        target (int): The vertex to reach.
+        reverse: The incoming edges of every vertex from ``reverse_adjacency``. Built
+            on demand for a directed graph; an undirected graph is its own reverse.
+
+    Returns:
+        Tuple[float, List[int]]: The path length and the path, or ``(inf, [])`` if
+        ``target`` is unreachable.
+    """
+    _check_vertex(graph, source)
+    _check_vertex(graph, target)
+    if source == target:
+        return 0, [source]
+    forward = _weighted_successors(graph)
+    if reverse is not None:
+        backward = reverse.__getitem__
+    elif graph.directed:
+        backward = reverse_adjacency(graph).__getitem__
+    else:
+        backward = forward
+
+    n = graph.vertices
+    dist = ([INF] * n, [INF] * n)
+    parents = ([NO_PARENT] * n, [NO_PARENT] * n)
+    settled = ([False] * n, [False] * n)
+    heaps = ([(0, source)], [(0, target)])
+    dist[0][source] = dist[1][target] = 0
+    best, bridge = INF, (NO_PARENT, NO_PARENT)
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, vertex = heappop(heaps[side])
+        if settled[side][vertex] or d > dist[side][vertex]:
+            continue
+        settled[side][vertex] = True
+        own, other, own_parents = dist[side], dist[1 - side], parents[side]
+        for dest, weight in (forward if side == 0 else backward)(vertex):
+            candidate = d + weight
+            if candidate < own[dest]:
+                own[dest] = candidate
+                own_parents[dest] = vertex
+                heappush(heaps[side], (candidate, dest))
+            if candidate + other[dest] < best:
+                # The edge joins the two searches; keep it in the forward direction.
+                best = candidate + other[dest]
+                bridge = (vertex, dest) if side == 0 else (dest, vertex)
+
+    if best == INF:
+        return INF, []
+    start, end = bridge
+    path = reconstruct_path(parents[0], source, start)
+    path.append(end)
+    while end != target:
+        end = parents[1][end]
+        path.append(end)
+    return best, path
@@ -0,0 +1,141 @@
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Generator, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # Without NumPy, distance_matrix returns a list of array rows.
+    np = None
+
+from CSRGraph import CSRGraph
+from Graph import UnweightedGraph, WeightedGraph
+from GraphAlgorithms import dijkstra
+
+AnyGraph = Union[UnweightedGraph, WeightedGraph, CSRGraph]
+
+# Per-worker state, set once by _init_worker instead of being pickled with every task.
+_graph: Optional[CSRGraph] = None
+_shared: Optional[shared_memory.SharedMemory] = None
+_matrix: Optional[memoryview] = None
+
+
+def _init_worker(path: str, matrix_name: Optional[str]) -> None:
+    global _graph, _shared, _matrix
+    _graph = CSRGraph.load(path)
+    if matrix_name is not None:
+        _shared = shared_memory.SharedMemory(name=matrix_name)
+        _matrix = _shared.buf.cast("d")
+
+
+def _distances(source: int) -> Tuple[int, array]:
+    dist, _ = dijkstra(_graph, source)
+    return source, array("d", dist)
+
+
+def _fill_row(task: Tuple[int, int]) -> int:
+    row, source = task
+    dist, _ = dijkstra(_graph, source)
+    n = _graph.vertices
+    _matrix[row * n:(row + 1) * n] = array("d", dist)
+    return row
+
+
+@contextmanager
+def _exported(graph: AnyGraph, path: Optional[str]) -> Generator[str, None, None]:
+    """
+    Saves the graph in CSR form for the workers to memory-map, and removes the file
+    afterwards unless the caller chose its path.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    if path is not None:
+        csr.save(path)
+        yield path
+        return
+    handle, temporary = tempfile.mkstemp(suffix=".csr")
+    os.close(handle)
+    try:
+        csr.save(temporary)
+        yield temporary
+    finally:
+        os.remove(temporary)
+
+
+def _chunksize(tasks: int, workers: Optional[int]) -> int:
+    return max(1, tasks // (4 * (workers or os.cpu_count() or 1)))
+
+
+def multi_source_distances(graph: AnyGraph, sources: Iterable[int], workers: Optional[int] = None,
+                           path: Optional[str] = None) -> Generator[Tuple[int, array], None, None]:
+    """
+    Runs Dijkstra from every source on a process pool and streams the results back.
+
+    The graph is written once as a CSR file that every worker memory-maps in its
+    initializer. Tasks carry only a source vertex, and all processes share the
+    graph's pages.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        sources (Iterable[int]): The vertices to start from.
+        workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+        path (Optional[str]): Where to write the CSR file. Defaults to a temporary file
+            that is removed afterwards.
+
+    Yields:
+        Tuple[int, array]: Each source, in input order, with an ``array('d')`` of the
+        distance to every vertex (``inf`` where unreachable).
+    """
+    sources = list(sources)
+    with _exported(graph, path) as csr_path:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(csr_path, None)) as executor:
+            yield from executor.map(_distances, sources, chunksize=_chunksize(len(sources), workers))
+
+
+def distance_matrix(graph: AnyGraph, sources: Iterable[int], workers: Optional[int] = None,
+                    path: Optional[str] = None) -> Union["np.ndarray", List[array]]:
+    """
+    Computes the distances from every source to every vertex on a process pool.
+
+    The workers write their rows straight into one shared-memory block, so results are
+    not pickled back. They share the graph as in ``multi_source_distances``.
+
+    Args:
+        graph: An ``UnweightedGraph``, ``WeightedGraph`` or ``CSRGraph``.
+        sources (Iterable[int]): The vertices to start from, one row each.
+        workers (Optional[int]): The number of worker processes. Defaults to the CPU count.
+        path (Optional[str]): Where to write the CSR file. Defaults to a temporary file.
+
+    Returns:
+        A ``(len(sources), graph.vertices)`` float64 NumPy array, or a list of
+        ``array('d')`` rows without NumPy. Unreachable vertices are ``inf``.
+    """
+    sources = list(sources)
+    rows, n = len(sources), graph.vertices
+    if rows == 0:
+        return np.empty((0, n)) if np is not None else []
+    shared = shared_memory.SharedMemory(create=True, size=max(1, 8 * rows * n))
+    try:
+        with _exported(graph, path) as csr_path:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(csr_path, shared.name)) as executor:
+                for _ in executor.map(_fill_row, enumerate(sources), chunksize=_chunksize(rows, workers)):
+                    pass
+        if np is not None:
+            return np.frombuffer(shared.buf, dtype=np.float64, count=rows * n).reshape(rows, n).copy()
+        view = shared.buf.cast("d")
+        try:
+            return [array("d", view[row * n:(row + 1) * n]) for row in range(rows)]
+        finally:
+            view.release()
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def all_pairs_distances(graph: AnyGraph, workers: Optional[int] = None) -> Union["np.ndarray", List[array]]:
+    """
+    Returns the full ``vertices x vertices`` distance matrix; see ``distance_matrix``.
+    """
+    return distance_matrix(graph, range(graph.vertices), workers)
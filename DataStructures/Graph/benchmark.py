@@ -0,0 +1,132 @@
+import importlib.util
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from CSRGraph import CSRGraph
+from Graph import WeightedGraph
+from ParallelShortestPaths import distance_matrix, multi_source_distances
+
+
+def random_edges(vertices: int, edges: int, seed: int = 0) -> List[Tuple[int, int, int]]:
+    """Return ``edges`` random weighted edges between ``vertices`` vertices."""
+    rng = random.Random(seed)
+    return [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100)) for _ in range(edges)]
+
+
+def measured(build: Callable[[], object], edges: int) -> Tuple[float, float]:
+    """Return the seconds ``build`` takes and the bytes it allocates per edge.
+
+    The two are measured in separate runs, since tracing allocations slows the build down.
+    """
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    graph = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return elapsed, current / edges
+
+
+def _add_one_by_one(vertices: int, edges: List[Tuple[int, int, int]], indexed: bool) -> WeightedGraph:
+    graph = WeightedGraph(vertices, indexed=indexed)
+    for start, dest, weight in edges:
+        graph.add_edge(start, dest, weight)
+    return graph
+
+
+def _add_in_bulk(vertices: int, edges: List[Tuple[int, int, int]]) -> WeightedGraph:
+    graph = WeightedGraph(vertices)
+    graph.add_edges(edges)
+    return graph
+
+
+def bench_build(vertices: int = 100_000, edges: int = 1_000_000, dense_vertices: int = 300) -> None:
+    """Compare build time and bytes per edge of the adjacency lists and the CSR form.
+
+    The dense graph has every vertex connected to most others, where the linear
+    ``has_edge`` scan in ``add_edge`` makes the plain build quadratic.
+    """
+    for label, n, m in (("sparse", vertices, edges), ("dense", dense_vertices, dense_vertices ** 2)):
+        edge_list = random_edges(n, m)
+        graph = _add_in_bulk(n, edge_list)
+        print(f"{label}: {n} vertices, {m} edges")
+        print(f"{'build':<28}{'seconds':>10}{'bytes/edge':>12}")
+        for name, build in (
+            ("WeightedGraph.add_edge", lambda: _add_one_by_one(n, edge_list, False)),
+            ("WeightedGraph indexed", lambda: _add_one_by_one(n, edge_list, True)),
+            ("WeightedGraph.add_edges", lambda: _add_in_bulk(n, edge_list)),
+            ("CSRGraph.from_graph", lambda: CSRGraph.from_graph(graph)),
+            ("CSRGraph.from_edges", lambda: CSRGraph.from_edges(n, edge_list)),
+        ):
+            elapsed, per_edge = measured(build, m)
+            print(f"{name:<28}{elapsed:>10.3f}{per_edge:>12.1f}")
+        print()
+
+
+def bench_parallel(vertices: int = 100_000, edges: int = 1_000_000, sources: int = 64,
+                   workers=(1, 2, 4, 8)) -> None:
+    """Time multi-source Dijkstra on 1, 2, 4 and 8 worker processes, streamed and into a shared matrix."""
+    graph = CSRGraph.from_edges(vertices, random_edges(vertices, edges))
+    chosen = random.Random(1).sample(range(vertices), sources)
+    print(f"{sources} sources, {vertices} vertices, {edges} edges")
+    print(f"{'workers':>8}{'stream s':>10}{'speedup':>9}{'matrix s':>10}{'speedup':>9}")
+    baseline = None
+    for count in workers:
+        start = time.perf_counter()
+        for _ in multi_source_distances(graph, chosen, count):
+            pass
+        streamed = time.perf_counter() - start
+        start = time.perf_counter()
+        distance_matrix(graph, chosen, count)
+        matrix = time.perf_counter() - start
+        if baseline is None:
+            baseline = (streamed, matrix)
+        print(f"{count:>8}{streamed:>10.3f}{baseline[0] / streamed:>9.2f}{matrix:>10.3f}{baseline[1] / matrix:>9.2f}")
+
+
+def import_time(statement: str, runs: int = 10) -> float:
+    """Return the median seconds a fresh interpreter needs to run ``statement``, less an empty run."""
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def median(code: str) -> float:
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=here, check=True)
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    return median(statement) - median("pass")
+
+
+def bench_import(runs: int = 10) -> None:
+    """Compare the import time of the DAG module with that of networkx and Matplotlib, which it now loads lazily."""
+    print(f"{'import':<40}{'ms':>8}")
+    cases = [("Directed_Acyclic_Graph", "import Directed_Acyclic_Graph")]
+    if importlib.util.find_spec("networkx") and importlib.util.find_spec("matplotlib"):
+        cases.append(("networkx + matplotlib.pyplot", "import networkx; from matplotlib import pyplot"))
+    else:
+        print(f"{'networkx + matplotlib.pyplot':<40}{'not installed':>8}")
+    for name, statement in cases:
+        print(f"{name:<40}{import_time(statement, runs) * 1000:>8.1f}")
+
+
+def main():
+    """
+    Runs the graph benchmarks.
+    """
+    bench_build()
+    bench_parallel()
+    bench_import()
+
+
+if __name__ == "__main__":
+    main()
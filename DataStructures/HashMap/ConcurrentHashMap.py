@@ -0,0 +1,192 @@
+import threading
+from typing import Any, Callable, Generator, Hashable, List, Optional, Tuple
+
+from HashMap import HashMap
+
+_MISSING = object()
+
+
+class ConcurrentHashMap:
+    """
+    A thread-safe hash map that splits its keys over independently locked ``HashMap`` shards.
+
+    Writers only lock the shard that owns their key, so threads working on different
+    shards never wait for each other. Reads take no lock at all: each shard carries a
+    version counter that writers make odd while they mutate it and even again when
+    they finish. A reader that sees the same even version before and after its lookup
+    knows no write overlapped it; otherwise it retries under the shard lock.
+    """
+
+    def __init__(self, shards: int = 16, capacity: int = 0, load_factor: float = 0.75,
+                 hash_function: Callable[[Hashable], int] = hash) -> None:
+        """Initialize an empty concurrent hash map.
+
+        Args:
+            shards: Number of independently locked partitions.
+            capacity: Number of entries the map should hold without rehashing.
+            load_factor: Maximum ratio of entries to buckets before a shard grows.
+            hash_function: Maps a key to an integer.
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.hash_function = hash_function
+        shard_capacity = -(-capacity // shards)
+        self._shards: List[HashMap] = [HashMap(shard_capacity, load_factor, hash_function)
+                                       for _ in range(shards)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shards)]
+        self._versions: List[int] = [0] * shards
+
+    def __len__(self) -> int:
+        """Return the number of key-value pairs across all shards."""
+        return sum(len(shard) for shard in self._shards)
+
+    def _shard_for(self, key: Hashable) -> int:
+        """Return the index of the shard that owns a key.
+
+        The hash is scrambled first so that the shard choice is independent of the
+        bucket choice inside the shard, which uses the same hash.
+        """
+        mixed = (self.hash_function(key) * 0x9E3779B1) & 0xFFFFFFFF
+        return (mixed >> 16) % len(self._shards)
+
+    def _mutate(self, index: int, operation: Callable[[HashMap], Any]) -> Any:
+        """Run ``operation`` on a shard while holding its lock and bumping its version.
+
+        Args:
+            index: The shard index.
+            operation: Called with the shard; its result is returned.
+        """
+        with self._locks[index]:
+            self._versions[index] += 1
+            try:
+                return operation(self._shards[index])
+            finally:
+                self._versions[index] += 1
+
+    def add(self, key: Hashable, value) -> bool:
+        """Add a key-value pair to the hash map.
+
+        Args:
+            key: The key to add.
+            value: The value associated with the key.
+
+        Returns:
+            True if the operation is successful.
+        """
+        return self._mutate(self._shard_for(key), lambda shard: shard.add(key, value))
+
+    def get(self, key: Hashable, default=None):
+        """Retrieve the value for a given key without taking a lock when possible.
+
+        Args:
+            key: The key to retrieve the value for.
+            default: The value to return when the key does not exist.
+
+        Returns:
+            The value associated with the key, or ``default`` if the key does not exist.
+        """
+        index = self._shard_for(key)
+        shard = self._shards[index]
+        version = self._versions[index]
+        if not version & 1:
+            try:
+                value = shard.get(key, default)
+            except (IndexError, TypeError):
+                # The shard swapped tables under us; fall through to the locked read.
+                pass
+            else:
+                if self._versions[index] == version:
+                    return value
+        with self._locks[index]:
+            return shard.get(key, default)
+
+    def delete(self, key: Hashable) -> bool:
+        """Delete a key-value pair from the hash map.
+
+        Args:
+            key: The key to delete.
+
+        Returns:
+            True if the key was deleted, False otherwise.
+        """
+        return self._mutate(self._shard_for(key), lambda shard: shard.delete(key))
+
+    def get_or_add(self, key: Hashable, value) -> Any:
+        """Atomically return the value of a key, adding ``value`` first if the key is absent.
+
+        Args:
+            key: The key to look up.
+            value: The value to store when the key does not exist.
+
+        Returns:
+            The value associated with the key after the call.
+        """
+        index = self._shard_for(key)
+        existing = self.get(key, _MISSING)
+        if existing is not _MISSING:
+            return existing
+
+        def operation(shard: HashMap) -> Any:
+            current = shard.get(key, _MISSING)
+            if current is not _MISSING:
+                return current
+            shard.add(key, value)
+            return value
+
+        return self._mutate(index, operation)
+
+    def compute(self, key: Hashable, function: Callable[[Optional[Any]], Optional[Any]]) -> Optional[Any]:
+        """Atomically replace the value of a key with ``function(old_value)``.
+
+        ``function`` receives None when the key is absent. If it returns None the
+        key is removed instead. It runs while the shard is locked, so it should be
+        quick and must not use this map.
+
+        Args:
+            key: The key to update.
+            function: Computes the new value from the current one.
+
+        Returns:
+            The new value, or None if the key was removed.
+        """
+        def operation(shard: HashMap) -> Optional[Any]:
+            new_value = function(shard.get(key))
+            if new_value is None:
+                shard.delete(key)
+            else:
+                shard.add(key, new_value)
+            return new_value
+
+        return self._mutate(self._shard_for(key), operation)
+
+    def items(self) -> Generator[Tuple[Hashable, Any], None, None]:
+        """Iterate over all key-value pairs, one shard snapshot at a time.
+
+        Each shard is copied under its lock, so the result is consistent per shard
+        but not across shards.
+
+        Yields:
+            Each (key, value) tuple.
+        """
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                snapshot = list(shard.items())
+            yield from snapshot
+
+    def keys(self) -> Generator[Hashable, None, None]:
+        """Iterate over all keys, one shard snapshot at a time.
+
+        Yields:
+            Each key.
+        """
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Generator[Any, None, None]:
+        """Iterate over all values, one shard snapshot at a time.
+
+        Yields:
+            Each value.
+        """
+        for _, value in self.items():
+            yield value
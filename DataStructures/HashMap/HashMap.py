@@ -1,88 +1,368 @@
+import math
+from typing import Any, Callable, Dict, Generator, Hashable, Iterable, List, Optional, Tuple
+
+
 class HashMap:
-    def __init__(self) -> None:
-        """Initialize the hash map with a fixed size and an empty map."""
-        self.size = 20
+    DEFAULT_SIZE = 20
+    REHASH_STEP = 4
+    ALLOCATION_STEP = 8192
+
+    def __init__(self, capacity: int = 0, load_factor: float = 0.75,
+                 hash_function: Callable[[Hashable], int] = hash) -> None:
+        """Initialize an empty hash map.
+
+        The table grows when the number of entries exceeds ``load_factor`` times
+        the number of buckets, and shrinks when it falls below a quarter of that.
+        Resizing is incremental: the new table is allocated ``ALLOCATION_STEP``
+        slots at a time and then a few buckets are moved on every operation,
+        instead of rebuilding the whole table at once.
+
+        Args:
+            capacity: Number of entries the map should hold without rehashing.
+            load_factor: Maximum ratio of entries to buckets before growing.
+            hash_function: Maps a key to an integer. Defaults to the built-in
+                ``hash``, which is well distributed for strings and tuples.
+        """
+        if load_factor <= 0:
+            raise ValueError("load_factor must be positive")
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self.load_factor = load_factor
+        self.hash_function = hash_function
+        self.size = max(self.DEFAULT_SIZE, math.ceil(capacity / load_factor))
         self.map = [None] * self.size
-    
-    def _get_hash(self, key: str) -> int:
+        self.count = 0
+        self._min_size = self.size
+        self._new_map: Optional[List[Optional[list]]] = None
+        self._new_size = 0
+        self._rehash_index = 0
+        self._rehash_count = 0
+
+    @classmethod
+    def from_iterable(cls, pairs: Iterable[Tuple[Hashable, Any]], load_factor: float = 0.75,
+                      hash_function: Callable[[Hashable], int] = hash) -> 'HashMap':
+        """Build a hash map from key-value pairs.
+
+        When ``pairs`` has a length the table is sized for it once up front, so
+        loading never rehashes.
+
+        Args:
+            pairs: The key-value pairs to load. Later duplicates overwrite earlier ones.
+            load_factor: Maximum ratio of entries to buckets before growing.
+            hash_function: Maps a key to an integer.
+
+        Returns:
+            A new hash map holding the pairs.
+        """
+        capacity = len(pairs) if hasattr(pairs, "__len__") else 0
+        hash_map = cls(capacity, load_factor, hash_function)
+        hash_map.add_many(pairs)
+        return hash_map
+
+    def __len__(self) -> int:
+        """Return the number of key-value pairs in the hash map."""
+        return self.count
+
+    def _get_hash(self, key: Hashable, size: int) -> int:
         """Generate a hash for a given key.
-        
+
         Args:
             key: The key to hash.
-        
+            size: The number of buckets in the target table.
+
         Returns:
             An integer hash value.
         """
-        return sum(ord(char) for char in str(key)) % self.size
-    
-    def add(self, key: str, value) -> bool:
+        return self.hash_function(key) % size
+
+    def _locate(self, key: Hashable) -> Tuple[list, int]:
+        """Find the table and bucket index that currently own a key.
+
+        While a rehash is in progress, buckets at or above ``_rehash_index`` have
+        already been moved to the new table and cut off the old one.
+
+        Args:
+            key: The key to locate.
+
+        Returns:
+            A (table, index) tuple.
+        """
+        index = self._get_hash(key, self.size)
+        if self._new_map is not None and index >= self._rehash_index:
+            return self._new_map, self._get_hash(key, self._new_size)
+        return self.map, index
+
+    def _start_rehash(self, new_size: int) -> None:
+        """Begin allocating the new table.
+
+        Args:
+            new_size: The number of buckets in the new table.
+        """
+        self._new_map = []
+        self._new_size = new_size
+        self._rehash_index = self.size
+        self._rehash_step()
+
+    def _rehash_step(self) -> None:
+        """Grow the new table by ``ALLOCATION_STEP`` slots until it is complete,
+        then move up to ``REHASH_STEP`` non-empty buckets into it per call.
+
+        No bucket moves before the new table is fully allocated, so lookups keep
+        using the old table until then. Buckets are then moved from the end of the
+        old table, which is truncated behind them, so neither table is allocated
+        or freed in one piece.
+        """
+        missing = self._new_size - len(self._new_map)
+        if missing:
+            self._new_map += [None] * min(missing, self.ALLOCATION_STEP)
+            return
+
+        moved = 0
+        visits = self.REHASH_STEP * 10
+        index = self._rehash_index
+        while index and moved < self.REHASH_STEP and visits:
+            index -= 1
+            bucket = self.map[index]
+            if bucket:
+                for pair in bucket:
+                    new_hash = self._get_hash(pair[0], self._new_size)
+                    if self._new_map[new_hash] is None:
+                        self._new_map[new_hash] = [pair]
+                    else:
+                        self._new_map[new_hash].append(pair)
+                moved += 1
+            visits -= 1
+        self._rehash_index = index
+        del self.map[index:]
+
+        if not index:
+            self.map = self._new_map
+            self.size = self._new_size
+            self._new_map = None
+            self._new_size = 0
+            self._rehash_index = 0
+            self._rehash_count += 1
+
+    def _finish_rehash(self) -> None:
+        """Allocate and move every remaining bucket of a running rehash at once."""
+        if self._new_map is not None:
+            self._new_map += [None] * (self._new_size - len(self._new_map))
+        while self._new_map is not None:
+            self._rehash_step()
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the table in one pass so it holds ``capacity`` entries without rehashing.
+
+        Args:
+            capacity: The number of entries to make room for.
+        """
+        self._finish_rehash()
+        size = math.ceil(capacity / self.load_factor)
+        if size > self.size:
+            self._start_rehash(size)
+            self._finish_rehash()
+
+    def _maybe_resize(self) -> None:
+        """Advance a running rehash, or start one if the load factor requires it."""
+        if self._new_map is not None:
+            self._rehash_step()
+        elif self.count > self.size * self.load_factor:
+            self._start_rehash(self.size * 2)
+        elif self.size > self._min_size and self.count < self.size * self.load_factor / 4:
+            self._start_rehash(max(self._min_size, self.size // 2))
+
+    def add(self, key: Hashable, value) -> bool:
         """Add a key-value pair to the hash map.
-        
+
         Args:
             key: The key to add.
             value: The value associated with the key.
-        
+
         Returns:
             True if the operation is successful.
         """
-        key_hash = self._get_hash(key)
+        table, key_hash = self._locate(key)
         key_value = [key, value]
 
-        if self.map[key_hash] is None:
-            self.map[key_hash] = [key_value]
+        if table[key_hash] is None:
+            table[key_hash] = [key_value]
         else:
-            for pair in self.map[key_hash]:
+            for pair in table[key_hash]:
                 if pair[0] == key:
                     pair[1] = value
                     return True
-            self.map[key_hash].append(key_value)
+            table[key_hash].append(key_value)
+        self.count += 1
+        self._maybe_resize()
         return True
-        
-    def get(self, key: str):
+
+    def get(self, key: Hashable, default=None):
         """Retrieve the value for a given key.
-        
+
         Args:
             key: The key to retrieve the value for.
-        
+            default: The value to return when the key does not exist.
+
         Returns:
-            The value associated with the key, or None if the key does not exist.
+            The value associated with the key, or ``default`` if the key does not exist.
         """
-        key_hash = self._get_hash(key)
-        if self.map[key_hash] is not None:
-            for pair in self.map[key_hash]:
+        table, key_hash = self._locate(key)
+        if table[key_hash] is not None:
+            for pair in table[key_hash]:
                 if pair[0] == key:
                     return pair[1]
-        return None
-        
-    def delete(self, key: str) -> bool:
+        return default
+
+    def delete(self, key: Hashable) -> bool:
         """Delete a key-value pair from the hash map.
-        
+
         Args:
             key: The key to delete.
-        
+
         Returns:
             True if the key was deleted, False otherwise.
         """
-        key_hash = self._get_hash(key)
+        table, key_hash = self._locate(key)
 
-        if self.map[key_hash] is not None:
-            for i, pair in enumerate(self.map[key_hash]):
+        if table[key_hash] is not None:
+            for i, pair in enumerate(table[key_hash]):
                 if pair[0] == key:
-                    self.map[key_hash].pop(i)
+                    table[key_hash].pop(i)
+                    self.count -= 1
+                    self._maybe_resize()
                     return True
         return False
 
-    def keys(self) -> list:
-        """Retrieve all keys in the hash map.
-        
+    def add_many(self, pairs: Iterable[Tuple[Hashable, Any]]) -> None:
+        """Add many key-value pairs in one call.
+
+        Sized inputs grow the table once before loading. Unsized inputs double it
+        in a single pass whenever the load factor is exceeded, which is cheaper
+        than incremental rehashing for a bulk load.
+
+        Args:
+            pairs: The key-value pairs to add. Later duplicates overwrite earlier ones.
+        """
+        if hasattr(pairs, "__len__"):
+            self._reserve(self.count + len(pairs))
+        else:
+            self._finish_rehash()
+
+        hash_function = self.hash_function
+        table, size = self.map, self.size
+        limit = size * self.load_factor
+        count = self.count
+        for key, value in pairs:
+            key_hash = hash_function(key) % size
+            bucket = table[key_hash]
+            if bucket is None:
+                table[key_hash] = [[key, value]]
+            else:
+                for pair in bucket:
+                    if pair[0] == key:
+                        pair[1] = value
+                        break
+                else:
+                    bucket.append([key, value])
+                    bucket = None
+                if bucket is not None:
+                    continue  # Existing key, value overwritten in place.
+            count += 1
+            if count > limit:
+                self.count = count
+                self._reserve(count * 2)
+                table, size = self.map, self.size
+                limit = size * self.load_factor
+        self.count = count
+
+    def get_many(self, keys: Iterable[Hashable]) -> list:
+        """Retrieve the values for many keys.
+
+        Args:
+            keys: The keys to look up.
+
         Returns:
-            A list of keys.
+            A list with the value of each key, or None where a key does not exist.
+        """
+        get = self.get
+        return [get(key) for key in keys]
+
+    def _buckets(self):
+        """Yield every non-empty bucket, including those of a table being rehashed."""
+        for table in (self.map, self._new_map):
+            if table is not None:
+                for bucket in table:
+                    if bucket:
+                        yield bucket
+
+    def keys(self) -> Generator[Hashable, None, None]:
+        """Iterate over all keys in the hash map without building a list.
+
+        The map must not be modified while the iteration is running.
+
+        Yields:
+            Each key.
         """
-        return [pair[0] for bucket in self.map if bucket for pair in bucket]
-        
+        for bucket in self._buckets():
+            for pair in bucket:
+                yield pair[0]
+
+    def values(self) -> Generator[Any, None, None]:
+        """Iterate over all values in the hash map without building a list.
+
+        Yields:
+            Each value.
+        """
+        for bucket in self._buckets():
+            for pair in bucket:
+                yield pair[1]
+
+    def items(self) -> Generator[Tuple[Hashable, Any], None, None]:
+        """Iterate over all key-value pairs in the hash map without building a list.
+
+        Yields:
+            Each (key, value) tuple.
+        """
+        for bucket in self._buckets():
+            for key, value in bucket:
+                yield key, value
+
     def print(self) -> None:
         """Print all key-value pairs in the hash map."""
-        for bucket in self.map:
-            if bucket:
-                for key_value in bucket:
-                    print(str(key_value))
\ No newline at end of file
+        for bucket in self._buckets():
+            for key_value in bucket:
+                print(str(key_value))
+
+    def stats(self) -> Dict[str, Any]:
+        """Report how evenly keys are spread over the buckets.
+
+        Nothing is counted on the lookup path; the probe figure is derived from
+        the chain lengths. While a resize is in progress, ``buckets`` and
+        ``load_factor`` describe the new table, and the chains not yet moved are
+        counted where they currently are.
+
+        Returns:
+            A dictionary with the entry and bucket counts, the load factor, a
+            histogram mapping chain length to number of buckets, the longest
+            chain, the average number of key comparisons for a ``get`` of a stored
+            key, whether a resize is running and the number of completed rehashes.
+        """
+        histogram: Dict[int, int] = {}
+        comparisons = 0
+        for bucket in self._buckets():
+            length = len(bucket)
+            histogram[length] = histogram.get(length, 0) + 1
+            comparisons += length * (length + 1) // 2
+        resizing = self._new_map is not None
+        buckets = self._new_size if resizing else self.size
+        histogram[0] = max(0, buckets - sum(histogram.values()))
+        return {
+            "count": self.count,
+            "buckets": buckets,
+            "load_factor": self.count / buckets,
+            "histogram": {length: n for length, n in sorted(histogram.items()) if n},
+            "max_chain": max(histogram),
+            "avg_probes": comparisons / self.count if self.count else 0.0,
+            "resizing": resizing,
+            "rehash_count": self._rehash_count,
+        }
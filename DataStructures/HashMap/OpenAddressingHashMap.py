@@ -0,0 +1,274 @@
+import math
+from array import array
+from typing import Any, Callable, Generator, Hashable, Iterable, List, Tuple
+
+
+class _Empty:
+    """Marker stored in the key array for slots that hold no entry."""
+
+    def __repr__(self) -> str:
+        return "<empty>"
+
+
+_EMPTY = _Empty()
+_HASH_MASK = 0x7FFFFFFFFFFFFFFF
+
+
+class OpenAddressingHashMap:
+    """
+    A hash map that stores entries directly in flat parallel arrays.
+
+    Hashes live in an ``array('q')`` while keys and values live in two plain lists,
+    so an entry costs three machine words instead of the per-entry and per-bucket
+    lists used by ``HashMap``. Collisions are resolved with Robin Hood linear
+    probing: an entry that has travelled further from its home slot takes the slot
+    of one that has travelled less, which keeps probe sequences short and lets a
+    failed lookup stop early. Deletion shifts the following entries back one slot
+    instead of leaving tombstones, so the table never needs a separate compaction
+    pass.
+    """
+
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity: int = 0, load_factor: float = 0.85,
+                 hash_function: Callable[[Hashable], int] = hash) -> None:
+        """Initialize an empty hash map.
+
+        Args:
+            capacity: Number of entries the map should hold without resizing.
+            load_factor: Maximum ratio of entries to slots before growing.
+            hash_function: Maps a key to an integer. Defaults to the built-in ``hash``.
+        """
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self.load_factor = load_factor
+        self.hash_function = hash_function
+        self.count = 0
+        self._min_slots = self._slots_for(capacity)
+        self._allocate(self._min_slots)
+
+    @classmethod
+    def from_iterable(cls, pairs: Iterable[Tuple[Hashable, Any]], load_factor: float = 0.85,
+                      hash_function: Callable[[Hashable], int] = hash) -> 'OpenAddressingHashMap':
+        """Build a hash map from key-value pairs, sized once up front when ``pairs`` has a length.
+
+        Args:
+            pairs: The key-value pairs to load. Later duplicates overwrite earlier ones.
+            load_factor: Maximum ratio of entries to slots before growing.
+            hash_function: Maps a key to an integer.
+
+        Returns:
+            A new hash map holding the pairs.
+        """
+        capacity = len(pairs) if hasattr(pairs, "__len__") else 0
+        hash_map = cls(capacity, load_factor, hash_function)
+        hash_map.add_many(pairs)
+        return hash_map
+
+    def __len__(self) -> int:
+        """Return the number of key-value pairs in the hash map."""
+        return self.count
+
+    def _slots_for(self, capacity: int) -> int:
+        """Return the smallest power of two that holds ``capacity`` entries under the load factor."""
+        needed = max(self.MIN_CAPACITY, math.ceil(capacity / self.load_factor) + 1)
+        return 1 << (needed - 1).bit_length()
+
+    def _allocate(self, slots: int) -> None:
+        """Replace the storage with ``slots`` empty slots."""
+        self._mask = slots - 1
+        self._hashes = array('q', bytes(8 * slots))
+        self._keys: List = [_EMPTY] * slots
+        self._values: List = [None] * slots
+
+    def _resize(self, slots: int) -> None:
+        """Rebuild the table with a new number of slots.
+
+        Args:
+            slots: The new number of slots, a power of two.
+        """
+        hashes, keys, values = self._hashes, self._keys, self._values
+        self._allocate(slots)
+        for i, key in enumerate(keys):
+            if key is not _EMPTY:
+                self._place(hashes[i], key, values[i])
+
+    def _place(self, key_hash: int, key: Hashable, value) -> None:
+        """Insert an entry known to be absent, displacing richer entries on the way.
+
+        Args:
+            key_hash: The masked hash of the key.
+            key: The key to insert.
+            value: The value associated with the key.
+        """
+        mask = self._mask
+        hashes, keys, values = self._hashes, self._keys, self._values
+        index = key_hash & mask
+        distance = 0
+        while True:
+            if keys[index] is _EMPTY:
+                hashes[index] = key_hash
+                keys[index] = key
+                values[index] = value
+                return
+            resident_distance = (index - hashes[index]) & mask
+            if resident_distance < distance:
+                hashes[index], key_hash = key_hash, hashes[index]
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                distance = resident_distance
+            index = (index + 1) & mask
+            distance += 1
+
+    def _find(self, key: Hashable, key_hash: int) -> int:
+        """Return the slot holding a key, or -1 if the key is absent.
+
+        Args:
+            key: The key to look up.
+            key_hash: The masked hash of the key.
+        """
+        mask = self._mask
+        hashes, keys = self._hashes, self._keys
+        index = key_hash & mask
+        distance = 0
+        while True:
+            resident = keys[index]
+            if resident is _EMPTY:
+                return -1
+            resident_hash = hashes[index]
+            if resident_hash == key_hash and (resident is key or resident == key):
+                return index
+            if ((index - resident_hash) & mask) < distance:
+                return -1
+            index = (index + 1) & mask
+            distance += 1
+
+    def add(self, key: Hashable, value) -> bool:
+        """Add a key-value pair to the hash map.
+
+        Args:
+            key: The key to add.
+            value: The value associated with the key.
+
+        Returns:
+            True if the operation is successful.
+        """
+        key_hash = self.hash_function(key) & _HASH_MASK
+        index = self._find(key, key_hash)
+        if index >= 0:
+            self._values[index] = value
+            return True
+        if self.count + 1 > len(self._keys) * self.load_factor:
+            self._resize(len(self._keys) * 2)
+        self._place(key_hash, key, value)
+        self.count += 1
+        return True
+
+    def get(self, key: Hashable, default=None):
+        """Retrieve the value for a given key.
+
+        Args:
+            key: The key to retrieve the value for.
+            default: The value to return when the key does not exist.
+
+        Returns:
+            The value associated with the key, or ``default`` if the key does not exist.
+        """
+        index = self._find(key, self.hash_function(key) & _HASH_MASK)
+        return self._values[index] if index >= 0 else default
+
+    def delete(self, key: Hashable) -> bool:
+        """Delete a key-value pair from the hash map.
+
+        The entries that follow the removed one in its probe run are shifted back
+        by one slot, so no tombstone is left behind.
+
+        Args:
+            key: The key to delete.
+
+        Returns:
+            True if the key was deleted, False otherwise.
+        """
+        index = self._find(key, self.hash_function(key) & _HASH_MASK)
+        if index < 0:
+            return False
+
+        mask = self._mask
+        hashes, keys, values = self._hashes, self._keys, self._values
+        following = (index + 1) & mask
+        while keys[following] is not _EMPTY and (following - hashes[following]) & mask:
+            hashes[index] = hashes[following]
+            keys[index] = keys[following]
+            values[index] = values[following]
+            index, following = following, (following + 1) & mask
+        keys[index] = _EMPTY
+        values[index] = None
+        self.count -= 1
+
+        slots = len(keys)
+        if slots > self._min_slots and self.count < slots * self.load_factor / 4:
+            self._resize(slots // 2)
+        return True
+
+    def add_many(self, pairs: Iterable[Tuple[Hashable, Any]]) -> None:
+        """Add many key-value pairs, growing the table once first when ``pairs`` has a length.
+
+        Args:
+            pairs: The key-value pairs to add. Later duplicates overwrite earlier ones.
+        """
+        if hasattr(pairs, "__len__"):
+            slots = self._slots_for(self.count + len(pairs))
+            if slots > len(self._keys):
+                self._resize(slots)
+        add = self.add
+        for key, value in pairs:
+            add(key, value)
+
+    def get_many(self, keys: Iterable[Hashable]) -> list:
+        """Retrieve the values for many keys.
+
+        Args:
+            keys: The keys to look up.
+
+        Returns:
+            A list with the value of each key, or None where a key does not exist.
+        """
+        get = self.get
+        return [get(key) for key in keys]
+
+    def keys(self) -> Generator[Hashable, None, None]:
+        """Iterate over all keys in the hash map without building a list.
+
+        Yields:
+            Each key.
+        """
+        for key in self._keys:
+            if key is not _EMPTY:
+                yield key
+
+    def values(self) -> Generator[Any, None, None]:
+        """Iterate over all values in the hash map without building a list.
+
+        Yields:
+            Each value.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _EMPTY:
+                yield value
+
+    def items(self) -> Generator[Tuple[Hashable, Any], None, None]:
+        """Iterate over all key-value pairs in the hash map without building a list.
+
+        Yields:
+            Each (key, value) tuple.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _EMPTY:
+                yield key, value
+
+    def print(self) -> None:
+        """Print all key-value pairs in the hash map."""
+        for key, value in self.items():
+            print(str([key, value]))
@@ -0,0 +1,154 @@
+import gc
+import random
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from ConcurrentHashMap import ConcurrentHashMap
+from HashMap import HashMap
+from OpenAddressingHashMap import OpenAddressingHashMap
+
+
+def build(factory: Callable[[], object], keys: List[int]):
+    """Fill a fresh map with ``key -> key`` for every key."""
+    hash_map = factory()
+    for key in keys:
+        hash_map.add(key, key)
+    return hash_map
+
+
+def memory_per_entry(factory: Callable[[], object], keys: List[int]) -> float:
+    """Return the bytes allocated by the map itself per stored entry.
+
+    The keys are created before tracing starts so only the table is measured.
+    """
+    tracemalloc.start()
+    hash_map = build(factory, keys)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hash_map
+    return current / len(keys)
+
+
+def lookup_latency(hash_map, keys: List[int]) -> float:
+    """Return the average time of a successful ``get`` in nanoseconds."""
+    get = hash_map.get
+    start = time.perf_counter()
+    for key in keys:
+        get(key)
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def bench_memory_and_lookup(n: int = 200_000) -> None:
+    """Compare the chained and the open-addressing maps on ``n`` random integer keys."""
+    keys = random.sample(range(n * 10), n)
+    probes = random.sample(keys, min(n, 100_000))
+    print(f"{'implementation':<24}{'bytes/entry':>12}{'get ns':>10}")
+    for name, factory in (("HashMap", HashMap), ("OpenAddressingHashMap", OpenAddressingHashMap)):
+        memory = memory_per_entry(factory, keys)
+        latency = lookup_latency(build(factory, keys), probes)
+        print(f"{name:<24}{memory:>12.1f}{latency:>10.1f}")
+
+
+def bench_bulk_load(n: int = 500_000) -> None:
+    """Compare loading ``n`` pairs one ``add`` at a time against ``from_iterable``."""
+    pairs = [(key, key) for key in random.sample(range(n * 10), n)]
+    print(f"{'implementation':<24}{'add loop s':>12}{'bulk s':>10}")
+    for name, cls in (("HashMap", HashMap), ("OpenAddressingHashMap", OpenAddressingHashMap)):
+        start = time.perf_counter()
+        build(cls, [key for key, _ in pairs])
+        looped = time.perf_counter() - start
+        start = time.perf_counter()
+        cls.from_iterable(pairs)
+        bulk = time.perf_counter() - start
+        print(f"{name:<24}{looped:>12.3f}{bulk:>10.3f}")
+
+
+def bench_add_pauses(n: int = 700_000) -> None:
+    """Report the slowest ``add`` that started or finished a resize, next to the slowest other ``add``.
+
+    The garbage collector is disabled while timing: a full collection pauses for
+    time proportional to every live object, whatever the map does.
+    """
+    hash_map = HashMap()
+    resizes: List[float] = []
+    others: List[float] = []
+    clock = time.perf_counter
+    gc.disable()
+    try:
+        for key in range(n):
+            resizing = hash_map._new_map is not None
+            start = clock()
+            hash_map.add(key, key)
+            elapsed = clock() - start
+            (resizes if resizing != (hash_map._new_map is not None) else others).append(elapsed)
+    finally:
+        gc.enable()
+    others.sort()
+    print(f"{'add':<24}{'worst ms':>10}")
+    print(f"{'starting/ending resize':<24}{max(resizes) * 1e3:>10.3f}")
+    print(f"{'other (99.99th pct)':<24}{others[int(len(others) * 0.9999)] * 1e3:>10.3f}")
+
+
+class _GlobalLockHashMap:
+    """A ``HashMap`` guarded by one lock, the baseline for the concurrent benchmark."""
+
+    def __init__(self) -> None:
+        self._map = HashMap()
+        self._lock = threading.Lock()
+
+    def add(self, key, value) -> bool:
+        with self._lock:
+            return self._map.add(key, value)
+
+    def get(self, key):
+        with self._lock:
+            return self._map.get(key)
+
+
+def bench_concurrent(threads: int = 8, operations: int = 50_000, write_ratio: float = 0.1) -> None:
+    """Measure mixed get/add throughput of a shared map from a thread pool.
+
+    Runs a single globally locked ``HashMap`` and ``ConcurrentHashMap`` with a
+    growing number of shards.
+    """
+    keys = list(range(100_000))
+
+    def worker(hash_map, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(operations):
+            key = rng.choice(keys)
+            if rng.random() < write_ratio:
+                hash_map.add(key, key)
+            else:
+                hash_map.get(key)
+
+    print(f"{'map':<24}{'ops/s':>12}")
+    candidates = [("global lock", _GlobalLockHashMap)]
+    candidates += [(f"{shards} shards", lambda shards=shards: ConcurrentHashMap(shards))
+                   for shards in (1, 2, 4, 8, 16, 32)]
+    for name, factory in candidates:
+        hash_map = factory()
+        for key in keys[::2]:
+            hash_map.add(key, key)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(lambda seed: worker(hash_map, seed), range(threads)))
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24}{threads * operations / elapsed:>12.0f}")
+
+
+def main():
+    """
+    Runs the hash map benchmarks.
+    """
+    bench_memory_and_lookup()
+    bench_bulk_load()
+    bench_add_pauses()
+    bench_concurrent()
+
+
+if __name__ == "__main__":
+    main()
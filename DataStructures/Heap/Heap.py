@@ -1,52 +1,120 @@
-from typing import List, TypeVar, Generic
+import operator
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
 
 T = TypeVar('T')
 
 class Heap(Generic[T]):
     """
     A generic heap class implementing the heap data structure for elements of any orderable type.
-    
+
     This class provides methods to add an element, remove the minimum element, and find the minimum element,
     with operations ensuring the heap property is maintained.
+
+    An optional ``key`` function orders elements by ``key(element)`` instead of the elements
+    themselves. Keys are computed once per element and kept in a parallel list, so no wrapper
+    objects are created. With ``max_heap=True`` the largest element is on top, and
+    ``findMin``/``pop``/``pushpop`` return the maximum instead of the minimum.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, key: Optional[Callable[[T], Any]] = None, max_heap: bool = False) -> None:
         self.__arr: List[T] = []
+        self.__key = key
+        self.__keys: Optional[List[Any]] = [] if key is not None else None
+        self.__before = operator.gt if max_heap else operator.lt
+        self.max_heap = max_heap
 
-    def __up(self, index: int) -> None:
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], key: Optional[Callable[[T], Any]] = None,
+                      max_heap: bool = False) -> 'Heap[T]':
         """
-        Bubbles the value at arr[index] up to maintain the heap property.
+        Builds a heap from all elements of an iterable in O(n) time.
         """
-        while index > 0 and self.__arr[index] < self.__arr[(parent := (index - 1) // 2)]:
-            self.__arr[index], self.__arr[parent] = self.__arr[parent], self.__arr[index]
-            index = parent
+        heap = cls(key, max_heap)
+        heap.__arr = list(iterable)
+        if key is not None:
+            heap.__keys = [key(value) for value in heap.__arr]
+        heap.heapify()
+        return heap
 
-    def __down(self, index: int) -> None:
+    def __len__(self) -> int:
         """
-        Bubbles the value at arr[index] down to maintain the heap property.
+        Returns the number of elements in the heap.
         """
-        n = len(self.__arr)
-        while index < n:
-            extreme = index
-            left = index * 2 + 1
-            right = index * 2 + 2
+        return len(self.__arr)
 
-            if left < n and self.__arr[left] < self.__arr[extreme]:
-                extreme = left
-            if right < n and self.__arr[right] < self.__arr[extreme]:
-                extreme = right
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over the elements in internal array order, which is not sorted order.
+        """
+        return iter(self.__arr)
 
-            if extreme == index:
-                break
+    def __up(self, index: int) -> None:
+        """
+        Moves the value at arr[index] up to maintain the heap property.
 
-            self.__arr[index], self.__arr[extreme] = self.__arr[extreme], self.__arr[index]
-            index = extreme
+        Parents are shifted down into the hole left by the value, which is written
+        once at its final position instead of being swapped at every level.
+        """
+        arr, keys, before = self.__arr, self.__keys, self.__before
+        value = arr[index]
+        if keys is None:
+            while index > 0:
+                parent = (index - 1) // 2
+                if not before(value, arr[parent]):
+                    break
+                arr[index] = arr[parent]
+                index = parent
+        else:
+            value_key = keys[index]
+            while index > 0:
+                parent = (index - 1) // 2
+                if not before(value_key, keys[parent]):
+                    break
+                arr[index] = arr[parent]
+                keys[index] = keys[parent]
+                index = parent
+            keys[index] = value_key
+        arr[index] = value
+
+    def __down(self, index: int) -> None:
+        """
+        Moves the value at arr[index] down to maintain the heap property.
+        """
+        arr, keys, before = self.__arr, self.__keys, self.__before
+        n = len(arr)
+        value = arr[index]
+        if keys is None:
+            while True:
+                child = index * 2 + 1
+                if child >= n:
+                    break
+                if child + 1 < n and before(arr[child + 1], arr[child]):
+                    child += 1
+                if not before(arr[child], value):
+                    break
+                arr[index] = arr[child]
+                index = child
+        else:
+            value_key = keys[index]
+            while True:
+                child = index * 2 + 1
+                if child >= n:
+                    break
+                if child + 1 < n and before(keys[child + 1], keys[child]):
+                    child += 1
+                if not before(keys[child], value_key):
+                    break
+                arr[index] = arr[child]
+                keys[index] = keys[child]
+                index = child
+            keys[index] = value_key
+        arr[index] = value
 
     def heapify(self) -> None:
         """
         Converts an arbitrary list into a heap by enforcing the heap invariant.
         """
-        for i in range(len(self.__arr) - 1, -1, -1):
+        for i in range(len(self.__arr) // 2 - 1, -1, -1):
             self.__down(i)
 
     def findMin(self) -> T:
@@ -62,21 +130,53 @@ class Heap(Generic[T]):
         Adds a new element to the heap.
         """
         self.__arr.append(value)
+        if self.__keys is not None:
+            self.__keys.append(self.__key(value))
         self.__up(len(self.__arr) - 1)
 
+    def push_many(self, values: Iterable[T]) -> None:
+        """
+        Adds several elements to the heap.
+
+        When the batch is at least as large as the heap, the whole array is re-heapified
+        in O(n) instead of sifting each new element up.
+        """
+        values = list(values)
+        start = len(self.__arr)
+        self.__arr.extend(values)
+        if self.__keys is not None:
+            self.__keys.extend(self.__key(value) for value in values)
+        if len(values) >= start:
+            self.heapify()
+        else:
+            for index in range(start, len(self.__arr)):
+                self.__up(index)
+
     def pop(self) -> T:
         """
         Removes and returns the minimum element from the heap.
         """
         if len(self.__arr) == 0:
             raise IndexError("pop from empty heap")
+        keys = self.__keys
         if len(self.__arr) == 1:
+            if keys is not None:
+                keys.pop()
             return self.__arr.pop()
         result = self.__arr[0]
         self.__arr[0] = self.__arr.pop()
+        if keys is not None:
+            keys[0] = keys.pop()
         self.__down(0)
         return result
 
+    def pop_many(self, k: int) -> List[T]:
+        """
+        Removes and returns up to ``k`` elements in heap order.
+        """
+        pop = self.pop
+        return [pop() for _ in range(min(k, len(self.__arr)))]
+
     def pushpop(self, value: T) -> T:
         """
         Pushes a new value onto the heap and then pops and returns the minimum element.
@@ -85,5 +185,78 @@ class Heap(Generic[T]):
             raise IndexError("pop from empty heap")
         result = self.__arr[0]
         self.__arr[0] = value
+        if self.__keys is not None:
+            self.__keys[0] = self.__key(value)
         self.__down(0)
-        return result
\ No newline at end of file
+        return result
+
+
+def nsmallest(n: int, iterable: Iterable[T], key: Optional[Callable[[T], Any]] = None) -> List[T]:
+    """
+    Returns the ``n`` smallest elements of an iterable in ascending order.
+
+    The iterable is consumed once while only ``n`` elements are kept in a bounded max-heap,
+    so memory stays O(n) however long the stream is.
+    """
+    return _select(n, iterable, key, largest=False)
+
+
+def nlargest(n: int, iterable: Iterable[T], key: Optional[Callable[[T], Any]] = None) -> List[T]:
+    """
+    Returns the ``n`` largest elements of an iterable in descending order, using O(n) memory.
+    """
+    return _select(n, iterable, key, largest=True)
+
+
+def _select(n: int, iterable: Iterable[T], key: Optional[Callable[[T], Any]], largest: bool) -> List[T]:
+    """
+    Keeps the best ``n`` elements seen so far in a heap whose top is the worst of them.
+    """
+    if n <= 0:
+        return []
+    key = key if key is not None else (lambda value: value)
+    before = operator.gt if largest else operator.lt
+    heap: Heap[T] = Heap(key, max_heap=not largest)
+    iterator = iter(iterable)
+    for value in iterator:
+        heap.push(value)
+        if len(heap) == n:
+            break
+    else:
+        return heap.pop_many(n)[::-1]
+
+    worst = key(heap.findMin())
+    for value in iterator:
+        value_key = key(value)
+        if before(value_key, worst):
+            heap.pushpop(value)
+            worst = key(heap.findMin())
+    return heap.pop_many(n)[::-1]
+
+
+def merge(*iterables: Iterable[T], key: Optional[Callable[[T], Any]] = None,
+          reverse: bool = False) -> Iterator[T]:
+    """
+    Lazily merges already sorted iterables into one sorted stream.
+
+    Only the current head of each input is held in memory. Equal elements are yielded in
+    the order of the iterables they came from. With ``reverse=True`` the inputs must be
+    sorted in descending order and the output is descending too.
+    """
+    key = key if key is not None else (lambda value: value)
+    direction = -1 if reverse else 1
+    heap: Heap[list] = Heap(max_heap=reverse)
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.push([key(value), order * direction, value, iterator])
+            break
+
+    while len(heap):
+        _, order, value, iterator = heap.findMin()
+        yield value
+        for value in iterator:
+            heap.pushpop([key(value), order, value, iterator])
+            break
+        else:
+            heap.pop()
@@ -0,0 +1,259 @@
+from array import array
+from typing import Iterable, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up the batch operations.
+    np = None
+
+Number = Union[int, float]
+
+
+class NumericHeap:
+    """
+    A min-heap of ints or floats stored unboxed in an ``array.array``.
+
+    Each element costs the size of its C type (8 bytes for the default ``'d'``) instead
+    of a pointer plus a boxed Python number, and an optional parallel ``array('q')``
+    carries an integer id per element. Single ``push``/``pop`` calls sift in Python
+    like ``Heap``. When NumPy is installed, ``push_batch`` and ``pop_batch`` switch to
+    vectorized paths for large batches: they re-sort the buffer in C, which is valid
+    because an ascending array already satisfies the heap property.
+    """
+
+    # A batch at least 1/REBUILD_RATIO of the heap is handled by re-sorting in NumPy.
+    REBUILD_RATIO = 64
+
+    def __init__(self, typecode: str = 'd', with_ids: bool = False) -> None:
+        """
+        Args:
+            typecode (str): An ``array`` type code for the priorities, e.g. ``'d'``, ``'f'`` or ``'q'``.
+            with_ids (bool): Whether to keep an integer id alongside every priority.
+        """
+        self.typecode = typecode
+        self._values = array(typecode)
+        self._ids: Optional[array] = array('q') if with_ids else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the heap.
+        """
+        return len(self._values)
+
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes used by the element buffers.
+        """
+        size = self._values.itemsize * len(self._values)
+        if self._ids is not None:
+            size += self._ids.itemsize * len(self._ids)
+        return size
+
+    def _up(self, index: int) -> None:
+        values, ids = self._values, self._ids
+        value = values[index]
+        value_id = ids[index] if ids is not None else 0
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not value < values[parent]:
+                break
+            values[index] = values[parent]
+            if ids is not None:
+                ids[index] = ids[parent]
+            index = parent
+        values[index] = value
+        if ids is not None:
+            ids[index] = value_id
+
+    def _down(self, index: int) -> None:
+        values, ids = self._values, self._ids
+        n = len(values)
+        value = values[index]
+        value_id = ids[index] if ids is not None else 0
+        while True:
+            child = 2 * index + 1
+            if child >= n:
+                break
+            if child + 1 < n and values[child + 1] < values[child]:
+                child += 1
+            if not values[child] < value:
+                break
+            values[index] = values[child]
+            if ids is not None:
+                ids[index] = ids[child]
+            index = child
+        values[index] = value
+        if ids is not None:
+            ids[index] = value_id
+
+    def heapify(self) -> None:
+        """
+        Restores the heap invariant over the whole buffer in O(n).
+        """
+        for i in range(len(self._values) // 2 - 1, -1, -1):
+            self._down(i)
+
+    def _check_id(self, value_id: Optional[int]) -> None:
+        if (value_id is None) != (self._ids is None):
+            raise ValueError("An id is required if and only if the heap was created with_ids=True.")
+
+    def findMin(self) -> Union[Number, Tuple[Number, int]]:
+        """
+        Returns the minimum priority, paired with its id when the heap keeps ids.
+        """
+        if not self._values:
+            raise IndexError("findMin on empty heap")
+        return self._values[0] if self._ids is None else (self._values[0], self._ids[0])
+
+    def push(self, value: Number, value_id: Optional[int] = None) -> None:
+        """
+        Adds a priority, and its id when the heap keeps ids.
+        """
+        self._check_id(value_id)
+        self._values.append(value)
+        if self._ids is not None:
+            self._ids.append(value_id)
+        self._up(len(self._values) - 1)
+
+    def pop(self) -> Union[Number, Tuple[Number, int]]:
+        """
+        Removes and returns the minimum priority, paired with its id when the heap keeps ids.
+        """
+        values, ids = self._values, self._ids
+        if not values:
+            raise IndexError("pop from empty heap")
+        result = values[0] if ids is None else (values[0], ids[0])
+        last_value = values.pop()
+        last_id = ids.pop() if ids is not None else 0
+        if values:
+            values[0] = last_value
+            if ids is not None:
+                ids[0] = last_id
+            self._down(0)
+        return result
+
+    def pushpop(self, value: Number, value_id: Optional[int] = None) -> Union[Number, Tuple[Number, int]]:
+        """
+        Replaces the minimum element with a new one and returns the old minimum.
+        """
+        self._check_id(value_id)
+        if not self._values:
+            raise IndexError("pop from empty heap")
+        result = self.findMin()
+        self._values[0] = value
+        if self._ids is not None:
+            self._ids[0] = value_id
+        self._down(0)
+        return result
+
+    def _replace(self, values, ids) -> None:
+        """
+        Replaces the buffers with the contents of NumPy arrays.
+        """
+        self._values = array(self.typecode, values.tobytes())
+        if self._ids is not None:
+            self._ids = array('q', ids.tobytes())
+
+    def push_batch(self, values: Iterable[Number], ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Adds many priorities, and their ids when the heap keeps ids.
+
+        Args:
+            values: A NumPy array, ``array.array`` or any iterable of numbers.
+            ids: The matching integer ids, required if and only if the heap keeps ids.
+        """
+        self._check_id(ids)
+        start = len(self._values)
+        if np is not None:
+            new_values = np.asarray(values if hasattr(values, "__len__") else list(values), dtype=self.typecode)
+            if ids is not None:
+                new_ids = np.asarray(ids if hasattr(ids, "__len__") else list(ids), dtype=np.int64)
+            else:
+                new_ids = None
+            if new_ids is not None and len(new_ids) != len(new_values):
+                raise ValueError("values and ids must have the same length.")
+            if len(new_values) * self.REBUILD_RATIO >= start:
+                all_values = np.concatenate([np.frombuffer(self._values, self.typecode), new_values])
+                if new_ids is None:
+                    self._replace(np.sort(all_values), None)
+                else:
+                    all_ids = np.concatenate([np.frombuffer(self._ids, np.int64), new_ids])
+                    order = np.argsort(all_values, kind="stable")
+                    self._replace(all_values[order], all_ids[order])
+                return
+            self._values.frombytes(new_values.tobytes())
+            if new_ids is not None:
+                self._ids.frombytes(new_ids.tobytes())
+        else:
+            self._values.extend(values)
+            if ids is not None:
+                self._ids.extend(ids)
+                if len(self._ids) != len(self._values):
+                    del self._values[start:], self._ids[start:]
+                    raise ValueError("values and ids must have the same length.")
+            if len(self._values) - start >= start:
+                self.heapify()
+                return
+        for index in range(start, len(self._values)):
+            self._up(index)
+
+    def pop_batch(self, k: int) -> Tuple[array, Optional[array]]:
+        """
+        Removes up to ``k`` of the smallest priorities.
+
+        Returns:
+            Tuple[array, Optional[array]]: The removed priorities in ascending order and
+            their ids, or None in place of the ids when the heap does not keep them.
+        """
+        k = min(k, len(self._values))
+        n = len(self._values)
+        if np is not None and k and k * self.REBUILD_RATIO >= n:
+            values = np.frombuffer(self._values, self.typecode)
+            if self._ids is None:
+                ordered = np.sort(values)
+                result = array(self.typecode, ordered[:k].tobytes())
+                self._replace(ordered[k:], None)
+                return result, None
+            order = np.argsort(values, kind="stable")
+            ordered_values = values[order]
+            ordered_ids = np.frombuffer(self._ids, np.int64)[order]
+            result = (array(self.typecode, ordered_values[:k].tobytes()),
+                      array('q', ordered_ids[:k].tobytes()))
+            self._replace(ordered_values[k:], ordered_ids[k:])
+            return result
+
+        popped_values = array(self.typecode)
+        popped_ids = array('q') if self._ids is not None else None
+        for _ in range(k):
+            item = self.pop()
+            if popped_ids is None:
+                popped_values.append(item)
+            else:
+                popped_values.append(item[0])
+                popped_ids.append(item[1])
+        return popped_values, popped_ids
+
+
+def top_k(values, k: int, largest: bool = True):
+    """
+    Returns the indices and values of the ``k`` largest (or smallest) entries of a NumPy array.
+
+    Selection uses ``numpy.argpartition`` in O(n) and only the ``k`` winners are sorted.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The indices into ``values`` and the values
+        themselves, best first.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("top_k requires NumPy.")
+    values = np.asarray(values)
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), values[:0]
+    keyed = -values if largest else values
+    indices = np.argpartition(keyed, k - 1)[:k]
+    indices = indices[np.argsort(keyed[indices], kind="stable")]
+    return indices, values[indices]
@@ -0,0 +1,163 @@
+from typing import Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class PairingNode(Generic[T]):
+    """
+    A node in a pairing heap, also used as the handle returned by ``PairingHeap.push``.
+
+    Attributes:
+        value: The element stored in the node.
+        child: The leftmost child.
+        sibling: The next sibling to the right.
+        prev: The left sibling, or the parent for a leftmost child. None for the root.
+    """
+
+    __slots__ = ("value", "child", "sibling", "prev")
+
+    def __init__(self, value: T) -> None:
+        self.value: T = value
+        self.child: Optional[PairingNode[T]] = None
+        self.sibling: Optional[PairingNode[T]] = None
+        self.prev: Optional[PairingNode[T]] = None
+
+
+def _link(a: PairingNode[T], b: PairingNode[T]) -> PairingNode[T]:
+    """
+    Makes the root with the larger value the leftmost child of the other and returns the new root.
+    """
+    if b.value < a.value:
+        a, b = b, a
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    a.sibling = a.prev = None
+    return a
+
+
+class PairingHeap(Generic[T]):
+    """
+    A pairing min-heap with the same interface as ``Heap`` plus O(1) ``meld`` and ``decrease_key``.
+
+    ``push`` and ``meld`` are O(1), ``decrease_key`` is O(1) (o(log n) amortized in
+    theory) and ``pop`` is O(log n) amortized. ``push`` returns the node holding the
+    value, which can later be passed to ``decrease_key``.
+    """
+
+    def __init__(self) -> None:
+        self.root: Optional[PairingNode[T]] = None
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the heap.
+        """
+        return self.count
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over the elements in no particular order.
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+
+    def findMin(self) -> T:
+        """
+        Returns the minimum element in the heap.
+        """
+        if self.root is None:
+            raise IndexError("findMin on empty heap")
+        return self.root.value
+
+    def push(self, value: T) -> PairingNode[T]:
+        """
+        Adds a new element to the heap and returns its node.
+        """
+        node = PairingNode(value)
+        self.root = node if self.root is None else _link(self.root, node)
+        self.count += 1
+        return node
+
+    def meld(self, other: 'PairingHeap[T]') -> None:
+        """
+        Moves every element of another pairing heap into this one in O(1). ``other`` is left empty.
+        """
+        if other.root is not None:
+            self.root = other.root if self.root is None else _link(self.root, other.root)
+            self.count += other.count
+            other.root, other.count = None, 0
+
+    def _merge_pairs(self, first: Optional[PairingNode[T]]) -> Optional[PairingNode[T]]:
+        """
+        Combines a sibling list into one tree with the standard two-pass pairing.
+
+        The first pass links siblings left to right in pairs, the second links the
+        resulting trees right to left. Both passes are iterative.
+        """
+        pairs: List[PairingNode[T]] = []
+        while first is not None:
+            second = first.sibling
+            if second is None:
+                first.prev = None
+                pairs.append(first)
+                break
+            following = second.sibling
+            pairs.append(_link(first, second))
+            first = following
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = _link(pairs.pop(), root)
+        return root
+
+    def pop(self) -> T:
+        """
+        Removes and returns the minimum element from the heap.
+        """
+        root = self.root
+        if root is None:
+            raise IndexError("pop from empty heap")
+        self.root = self._merge_pairs(root.child)
+        root.child = None
+        self.count -= 1
+        return root.value
+
+    def pushpop(self, value: T) -> T:
+        """
+        Replaces the minimum element with a new value and returns the old minimum.
+        """
+        result = self.pop()
+        self.push(value)
+        return result
+
+    def decrease_key(self, node: PairingNode[T], value: T) -> None:
+        """
+        Lowers the value held by a node returned from ``push``.
+
+        Raises:
+            ValueError: If the new value is greater than the current one.
+        """
+        if node.value < value:
+            raise ValueError("decrease_key cannot increase the value.")
+        node.value = value
+        if node is self.root:
+            return
+        # Cut the node's subtree out of its sibling list and link it with the root.
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+        self.root = _link(self.root, node)
@@ -0,0 +1,133 @@
+from typing import Any, Callable, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class RadixHeap(Generic[T]):
+    """
+    A monotone radix heap for elements with non-negative integer priorities.
+
+    The heap is monotone: every pushed priority must be at least the priority of the
+    last popped element, which holds for Dijkstra-style and event-simulation
+    workloads. Elements are kept in buckets by the highest bit in which their priority
+    differs from the last popped one, so ``push`` is O(1) and each element is moved
+    between buckets at most once per bit, giving O(log C) amortized ``pop`` for a
+    priority range C, with no element comparisons at all.
+
+    By default the elements are the integer priorities themselves; pass ``key`` to
+    store other elements, e.g. ``(distance, vertex)`` tuples with ``key=itemgetter(0)``.
+    """
+
+    def __init__(self, key: Optional[Callable[[T], int]] = None) -> None:
+        self.key = key
+        self.last: int = 0
+        self.count: int = 0
+        self._buckets: List[List[Tuple[int, Any]]] = [[] for _ in range(65)]
+        # The last-filed entry of least priority in each bucket, and the one ``pop`` returns next.
+        self._bucket_min: List[Optional[Tuple[int, Any]]] = [None] * 65
+        self._min: Optional[Tuple[int, Any]] = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the heap.
+        """
+        return self.count
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over the elements in no particular order.
+        """
+        for bucket in self._buckets:
+            for _, value in bucket:
+                yield value
+
+    def _insert(self, priority: int, value: T) -> None:
+        """
+        Files an element under the bucket for its priority relative to ``last``.
+        """
+        index = (priority ^ self.last).bit_length()
+        while index >= len(self._buckets):
+            self._buckets.append([])
+            self._bucket_min.append(None)
+        entry = (priority, value)
+        self._buckets[index].append(entry)
+        smallest = self._bucket_min[index]
+        if smallest is None or priority <= smallest[0]:
+            self._bucket_min[index] = entry
+
+    def _settle(self) -> None:
+        """
+        Ensures bucket 0 holds the minimum, redistributing the first non-empty bucket if needed.
+        """
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        index = 1
+        while not buckets[index]:
+            index += 1
+        bucket = buckets[index]
+        buckets[index] = []
+        self.last = self._bucket_min[index][0]
+        self._bucket_min[index] = None
+        for priority, value in bucket:
+            self._insert(priority, value)
+
+    def findMin(self) -> T:
+        """
+        Returns the element with the minimum priority, the one ``pop`` would return, in O(1).
+
+        The minimum is tracked by ``push`` and ``pop``, so no bucket is redistributed and
+        ``last`` does not move until something is popped.
+        """
+        if self.count == 0:
+            raise IndexError("findMin on empty heap")
+        return self._min[1]
+
+    def _priority(self, value: T) -> int:
+        return value if self.key is None else self.key(value)
+
+    def push(self, value: T) -> None:
+        """
+        Adds a new element to the heap.
+
+        Raises:
+            ValueError: If its priority is lower than that of the last popped element.
+        """
+        priority = self._priority(value)
+        if priority < self.last:
+            raise ValueError(f"RadixHeap is monotone: {priority} is below the last popped priority {self.last}.")
+        self._insert(priority, value)
+        self.count += 1
+        # Ties go to the later element, which is also the one its bucket yields first.
+        if self._min is None or priority <= self._min[0]:
+            self._min = (priority, value)
+
+    def pop(self) -> T:
+        """
+        Removes and returns the element with the minimum priority.
+        """
+        if self.count == 0:
+            raise IndexError("pop from empty heap")
+        self._settle()
+        self.count -= 1
+        buckets = self._buckets
+        value = buckets[0].pop()[1]
+        if buckets[0]:
+            self._min = buckets[0][-1]
+        else:
+            self._min = next((entry for entry in self._bucket_min[1:] if entry is not None), None)
+        return value
+
+    def pushpop(self, value: T) -> T:
+        """
+        Replaces the minimum element with a new value and returns the old minimum.
+
+        Raises:
+            ValueError: If the new priority is below the minimum's. The heap is left unchanged.
+        """
+        priority = self._priority(value)
+        if self.count and priority < self._min[0]:
+            raise ValueError(f"RadixHeap is monotone: {priority} is below the minimum priority {self._min[0]}.")
+        result = self.pop()
+        self.push(value)
+        return result
@@ -0,0 +1,148 @@
+import random
+import time
+import tracemalloc
+from operator import itemgetter
+from typing import Callable, Dict, List, Tuple
+
+from DaryHeap import DaryHeap
+from Heap import Heap
+from NumericHeap import NumericHeap
+from PairingHeap import PairingHeap
+from RadixHeap import RadixHeap
+
+ENGINES: Dict[str, Callable[[], object]] = {
+    "Heap (binary)": Heap,
+    "DaryHeap (d=4)": DaryHeap,
+    "PairingHeap": PairingHeap,
+    "RadixHeap": RadixHeap,
+}
+
+
+def push_heavy(factory: Callable[[], object], n: int) -> None:
+    """Push ``n`` random integers and pop only a tenth of them."""
+    heap = factory()
+    push, pop = heap.push, heap.pop
+    for value in random.Random(1).choices(range(n * 10), k=n):
+        push(value)
+    for _ in range(n // 10):
+        pop()
+
+
+def pop_heavy(factory: Callable[[], object], n: int) -> None:
+    """Push ``n`` random integers and pop every one of them."""
+    heap = factory()
+    push, pop = heap.push, heap.pop
+    for value in random.Random(1).choices(range(n * 10), k=n):
+        push(value)
+    for _ in range(n):
+        pop()
+
+
+def _random_graph(n: int, degree: int) -> List[List[Tuple[int, int]]]:
+    rng = random.Random(2)
+    return [[(rng.randrange(n), rng.randint(1, 100)) for _ in range(degree)] for _ in range(n)]
+
+
+def decrease_key_heavy(name: str, graph: List[List[Tuple[int, int]]]) -> None:
+    """Run Dijkstra on a dense random graph, where most relaxations lower a queued distance.
+
+    ``PairingHeap`` uses its native ``decrease_key``; the other engines push a new
+    ``(distance, vertex)`` entry and skip stale ones when they are popped.
+    """
+    n = len(graph)
+    dist = [float("inf")] * n
+    dist[0] = 0
+    if name == "PairingHeap":
+        heap = PairingHeap()
+        handles = {0: heap.push((0, 0))}
+        while len(heap):
+            d, u = heap.pop()
+            del handles[u]
+            for v, weight in graph[u]:
+                candidate = d + weight
+                if candidate < dist[v]:
+                    dist[v] = candidate
+                    if v in handles:
+                        heap.decrease_key(handles[v], (candidate, v))
+                    else:
+                        handles[v] = heap.push((candidate, v))
+        return
+
+    heap = RadixHeap(key=itemgetter(0)) if name == "RadixHeap" else ENGINES[name]()
+    heap.push((0, 0))
+    while len(heap):
+        d, u = heap.pop()
+        if d > dist[u]:
+            continue
+        for v, weight in graph[u]:
+            candidate = d + weight
+            if candidate < dist[v]:
+                dist[v] = candidate
+                heap.push((candidate, v))
+
+
+def timed(function: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def bench_numeric_memory(n: int = 1_000_000) -> None:
+    """Compare bytes per element and batch push/pop time of ``Heap`` and ``NumericHeap`` on float scores.
+
+    ``Heap`` is given freshly boxed floats so their objects count towards its memory.
+    """
+    scores = [random.random() for _ in range(n)]
+    ids = list(range(n))
+    print(f"{'engine':<28}{'bytes/elem':>12}{'push s':>10}{'pop 10% s':>12}")
+    for name, build in (
+        ("Heap (float)", lambda: Heap.from_iterable(score * 1.0 for score in scores)),
+        ("Heap ((float, id) tuples)", lambda: Heap.from_iterable((score * 1.0, i) for score, i in zip(scores, ids))),
+        ("NumericHeap", lambda: _numeric(scores, None)),
+        ("NumericHeap (with ids)", lambda: _numeric(scores, ids)),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        heap = build()
+        pushed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        if isinstance(heap, NumericHeap):
+            heap.pop_batch(n // 10)
+        else:
+            heap.pop_many(n // 10)
+        popped = time.perf_counter() - start
+        print(f"{name:<28}{current / n:>12.1f}{pushed:>10.3f}{popped:>12.3f}")
+
+
+def _numeric(scores: List[float], ids) -> NumericHeap:
+    heap = NumericHeap(with_ids=ids is not None)
+    heap.push_batch(scores, ids)
+    return heap
+
+
+def main(n: int = 200_000):
+    """
+    Times every heap engine on push-heavy, pop-heavy and decrease-key-heavy workloads
+    and reports the winner of each.
+    """
+    graph = _random_graph(n // 10, 40)
+    workloads = {
+        "push-heavy": lambda name: push_heavy(ENGINES[name], n),
+        "pop-heavy": lambda name: pop_heavy(ENGINES[name], n),
+        "decrease-key-heavy": lambda name: decrease_key_heavy(name, graph),
+    }
+    print(f"{'engine':<18}" + "".join(f"{workload:>20}" for workload in workloads))
+    results = {name: {workload: timed(lambda: run(name)) for workload, run in workloads.items()}
+               for name in ENGINES}
+    for name, times in results.items():
+        print(f"{name:<18}" + "".join(f"{times[workload]:>19.3f}s" for workload in workloads))
+    for workload in workloads:
+        winner = min(results, key=lambda name: results[name][workload])
+        print(f"{workload}: {winner}")
+    bench_numeric_memory()
+
+
+if __name__ == "__main__":
+    main()
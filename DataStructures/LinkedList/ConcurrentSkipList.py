@@ -0,0 +1,205 @@
+import threading
+import time
+from typing import Any, Generator, List, Optional
+
+from SkipList import SkipList, SkipNode
+
+
+class ConcurrentSkipNode(SkipNode):
+    """
+    A skip list node with its own lock and the two flags of the lazy skip list.
+
+    Attributes:
+        lock (threading.Lock): Held while the node's links, or the node itself, change.
+        marked (bool): Set once the node is logically deleted, before it is unlinked.
+        fully_linked (bool): Set once the node is linked on all of its levels.
+    """
+
+    __slots__ = ("lock", "marked", "fully_linked")
+
+    def __init__(self, key: Any, value: Any, level: int) -> None:
+        super().__init__(key, value, level)
+        self.lock: threading.Lock = threading.Lock()
+        self.marked: bool = False
+        self.fully_linked: bool = False
+
+
+class ConcurrentSkipList(SkipList):
+    """
+    Implements a thread-safe skip list with fine-grained locking (the lazy skip list of
+    Herlihy, Lev, Luchangco and Shavit).
+
+    Writers lock only the predecessors of the node they change, at most one lock per
+    level, so writers touching different parts of the list do not block each other.
+    Every write first searches without locks, then locks and validates that the
+    predecessors are still unmarked and still point where the search saw them. If not,
+    it retries. A delete marks its node before unlinking it.
+
+    Readers take no locks at all. A key is present when its node is fully linked and
+    not marked. Iteration is weakly consistent: it never fails under concurrent writes
+    and skips nodes that are being inserted or deleted.
+    """
+
+    def __init__(self, max_level: int = 16, p: float = 0.25, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            max_level (int): The most levels a node may have. Every operation visits all
+                of them, so the default is lower than ``SkipList``'s.
+            p (float): The probability of promoting a node to the next level.
+            seed (Optional[int]): Seeds the level generator.
+        """
+        super().__init__(max_level, p, seed)
+        self.head.fully_linked = True
+        self.level = max_level
+        self._random_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+
+    def _new_node(self, key: Any, value: Any, level: int) -> ConcurrentSkipNode:
+        return ConcurrentSkipNode(key, value, level)
+
+    def _random_level(self) -> int:
+        with self._random_lock:
+            return super()._random_level()
+
+    def _find(self, key: Any, predecessors: List[SkipNode], successors: List[Optional[SkipNode]]) -> int:
+        """
+        Fills the predecessor and successor of ``key`` on every level, without locking.
+
+        Returns:
+            int: The highest level on which a node with ``key`` was found, or -1.
+        """
+        found = -1
+        node = self.head
+        for i in range(self.max_level - 1, -1, -1):
+            following = node.next[i]
+            while following is not None and following.key < key:
+                node, following = following, following.next[i]
+            if found == -1 and following is not None and following.key == key:
+                found = i
+            predecessors[i] = node
+            successors[i] = following
+        return found
+
+    def _nodes_from(self, node: Optional[ConcurrentSkipNode]) -> Generator[ConcurrentSkipNode, None, None]:
+        while node is not None:
+            if node.fully_linked and not node.marked:
+                yield node
+            node = node.next[0]
+
+    def _predecessors(self, key: Any) -> List[SkipNode]:
+        predecessors = [self.head] * self.max_level
+        self._find(key, predecessors, [None] * self.max_level)
+        return predecessors
+
+    def search(self, key: Any) -> Optional[ConcurrentSkipNode]:
+        """
+        Finds the node holding a key, without locking.
+
+        Returns:
+            Optional[ConcurrentSkipNode]: The node, or None if the key is not in the list.
+        """
+        successors = [None] * self.max_level
+        found = self._find(key, [self.head] * self.max_level, successors)
+        if found == -1:
+            return None
+        node = successors[found]
+        return node if node.fully_linked and not node.marked else None
+
+    def insert(self, key: Any, value: Any = None) -> bool:
+        """
+        Inserts a key, or replaces the value of an existing key.
+
+        Returns:
+            bool: True if the key was added, False if an existing value was replaced.
+        """
+        level = self._random_level()
+        predecessors = [self.head] * self.max_level
+        successors = [None] * self.max_level
+        while True:
+            found = self._find(key, predecessors, successors)
+            if found != -1:
+                node = successors[found]
+                if not node.marked:
+                    while not node.fully_linked:
+                        time.sleep(0)  # Yield to the inserting thread instead of spinning.
+                    node.value = value
+                    return False
+                time.sleep(0)  # The node is being deleted: let the deleter unlink it, then retry.
+                continue
+
+            locked = []
+            try:
+                valid = True
+                for i in range(level):
+                    previous, following = predecessors[i], successors[i]
+                    if not locked or locked[-1] is not previous:
+                        previous.lock.acquire()
+                        locked.append(previous)
+                    valid = (not previous.marked and (following is None or not following.marked)
+                             and previous.next[i] is following)
+                    if not valid:
+                        break
+                if not valid:
+                    continue
+                node = self._new_node(key, value, level)
+                for i in range(level):
+                    node.next[i] = successors[i]
+                for i in range(level):
+                    predecessors[i].next[i] = node
+                node.fully_linked = True
+            finally:
+                for previous in locked:
+                    previous.lock.release()
+            with self._counter_lock:
+                self.counter += 1
+            return True
+
+    def delete(self, key: Any) -> bool:
+        """
+        Deletes a key, if present.
+
+        Returns:
+            bool: True if this call removed the key, False if it was not in the list.
+        """
+        victim = None
+        marked = False
+        predecessors = [self.head] * self.max_level
+        successors = [None] * self.max_level
+        while True:
+            found = self._find(key, predecessors, successors)
+            if not marked:
+                if found == -1:
+                    return False
+                victim = successors[found]
+                if not (victim.fully_linked and len(victim.next) - 1 == found and not victim.marked):
+                    return False
+                victim.lock.acquire()
+                if victim.marked:
+                    victim.lock.release()
+                    return False
+                victim.marked = True
+                marked = True
+
+            level = len(victim.next)
+            locked = []
+            try:
+                valid = True
+                for i in range(level):
+                    previous = predecessors[i]
+                    if not locked or locked[-1] is not previous:
+                        previous.lock.acquire()
+                        locked.append(previous)
+                    valid = not previous.marked and previous.next[i] is victim
+                    if not valid:
+                        break
+                if not valid:
+                    continue
+                for i in range(level - 1, -1, -1):
+                    predecessors[i].next[i] = victim.next[i]
+                victim.lock.release()
+            finally:
+                for previous in locked:
+                    previous.lock.release()
+            with self._counter_lock:
+                self.counter -= 1
+            return True
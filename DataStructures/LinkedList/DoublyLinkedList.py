@@ -10,6 +10,8 @@ class Node:
         next (Optional[Node]): A reference to the next node in the list.
     """
 
+    __slots__ = ("data", "prev", "next")
+
     def __init__(self, data: int, prev: 'Optional[Node]' = None, next: 'Optional[Node]' = None) -> None:
         self.data: int = data
         self.prev: Optional[Node] = prev
@@ -39,7 +41,7 @@ class DoublyLinkedList:
     def traverse(self) -> str:
         return " <-> ".join([str(node.data) for node in self])
 
-    def insert_start(self, value: int) -> None:
+    def insert_start(self, value: int) -> Node:
         node = Node(value, next=self.head)
         if self.head:
             self.head.prev = node
@@ -47,8 +49,9 @@ class DoublyLinkedList:
         if self.tail is None:
             self.tail = node
         self.counter += 1
+        return node
 
-    def insert_end(self, value: int) -> None:
+    def insert_end(self, value: int) -> Node:
         node = Node(value, prev=self.tail)
         if self.tail:
             self.tail.next = node
@@ -56,23 +59,39 @@ class DoublyLinkedList:
         if self.head is None:
             self.head = node
         self.counter += 1
+        return node
 
     def remove(self, value: int) -> None:
         current = self.head
         while current:
             if current.data == value:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self.tail = current.prev
-                self.counter -= 1
+                self.unlink(current)
                 return
             current = current.next
         raise ValueError("Value not found in the list.")
 
+    def unlink(self, node: Node) -> Node:
+        # O(1): the caller already holds the node, so no search is needed.
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.counter -= 1
+        return node
+
+    def move_to_end(self, node: Node) -> None:
+        if node is self.tail:
+            return
+        self.unlink(node)
+        node.prev = self.tail
+        self.tail.next = node
+        self.tail = node
+        self.counter += 1
+
     def size(self) -> int:
-        return self.counter
\ No newline at end of file
+        return self.counter
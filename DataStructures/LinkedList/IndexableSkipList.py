@@ -0,0 +1,118 @@
+from typing import Any, List, Tuple
+
+from SkipList import SkipList, SkipNode
+
+
+class IndexableSkipNode(SkipNode):
+    """
+    A skip list node that also records how many level-0 steps each of its links spans.
+    """
+
+    __slots__ = ("width",)
+
+    def __init__(self, key: Any, value: Any, level: int) -> None:
+        super().__init__(key, value, level)
+        self.width: List[int] = [1] * level
+
+
+class IndexableSkipList(SkipList):
+    """
+    Implements a skip list that also answers positional queries.
+
+    Every link stores its width: the number of level-0 steps it jumps over. A missing
+    link spans to the end of the list. Summing widths along a search path gives the
+    position of a node, which makes ``rank`` and ``select`` expected O(log n), the same
+    cost as a search.
+    """
+
+    def _new_node(self, key: Any, value: Any, level: int) -> IndexableSkipNode:
+        return IndexableSkipNode(key, value, level)
+
+    def _predecessors_with_positions(self, key: Any) -> Tuple[List[SkipNode], List[int]]:
+        """
+        Returns, for every level, the last node whose key is less than ``key`` and its
+        position, with the head at position -1.
+        """
+        update = [self.head] * self.max_level
+        positions = [-1] * self.max_level
+        node, position = self.head, -1
+        for i in range(self.level - 1, -1, -1):
+            following = node.next[i]
+            while following is not None and following.key < key:
+                position += node.width[i]
+                node, following = following, following.next[i]
+            update[i] = node
+            positions[i] = position
+        return update, positions
+
+    def insert(self, key: Any, value: Any = None) -> bool:
+        """
+        Inserts a key, or replaces the value of an existing key.
+
+        Returns:
+            bool: True if the key was added, False if an existing value was replaced.
+        """
+        update, positions = self._predecessors_with_positions(key)
+        node = update[0].next[0]
+        if node is not None and node.key == key:
+            node.value = value
+            return False
+        level = self._random_level()
+        self.level = max(self.level, level)
+        node = self._new_node(key, value, level)
+        position = positions[0] + 1
+        for i in range(level):
+            previous = update[i]
+            node.next[i] = previous.next[i]
+            previous.next[i] = node
+            node.width[i] = positions[i] + previous.width[i] + 1 - position
+            previous.width[i] = position - positions[i]
+        for i in range(level, self.max_level):
+            update[i].width[i] += 1
+        self.counter += 1
+        return True
+
+    def delete(self, key: Any) -> bool:
+        """
+        Deletes a key, if present.
+
+        Returns:
+            bool: True if the key was removed, False if it was not in the list.
+        """
+        update, _ = self._predecessors_with_positions(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return False
+        level = len(node.next)
+        for i in range(level):
+            update[i].next[i] = node.next[i]
+            update[i].width[i] += node.width[i] - 1
+        for i in range(level, self.max_level):
+            update[i].width[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.counter -= 1
+        return True
+
+    def rank(self, key: Any) -> int:
+        """
+        Returns the number of keys strictly less than ``key``.
+        """
+        _, positions = self._predecessors_with_positions(key)
+        return positions[0] + 1
+
+    def select(self, k: int) -> IndexableSkipNode:
+        """
+        Returns the node with the k-th smallest key, counting from 0.
+
+        Raises:
+            IndexError: If k is not in the range [0, len(list)).
+        """
+        if not 0 <= k < self.counter:
+            raise IndexError("select index out of range")
+        node, remaining = self.head, k + 1
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.width[i] <= remaining:
+                remaining -= node.width[i]
+                node = node.next[i]
+        return node
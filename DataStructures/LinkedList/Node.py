@@ -10,6 +10,8 @@ class Node:
         next: The next node in the list.
     """
 
+    __slots__ = ("data", "next")
+
     def __init__(self, data: int) -> None:
         self.data: int = data
         self.next: Optional[Node] = None
\ No newline at end of file
@@ -0,0 +1,187 @@
+import random
+from typing import Any, Generator, List, Optional, Tuple
+
+MAX_LEVEL = 32
+P = 0.25
+
+
+class SkipNode:
+    """
+    A node in a skip list.
+
+    Attributes:
+        key: The key the list is ordered by.
+        value: The value stored alongside the key.
+        next (List[Optional[SkipNode]]): The following node on each level the node belongs to.
+    """
+
+    __slots__ = ("key", "value", "next")
+
+    def __init__(self, key: Any, value: Any, level: int) -> None:
+        self.key: Any = key
+        self.value: Any = value
+        self.next: List[Optional[SkipNode]] = [None] * level
+
+
+class SkipList:
+    """
+    Implements a skip list used as an ordered map.
+
+    Every node sits on level 0, a sorted singly linked list, and is promoted to each
+    further level with probability ``p``. The sparser upper levels act as express lanes,
+    so search, insert and delete run in expected O(log n) without any rebalancing: an
+    update only relinks the neighbours of one node. Keys are unique and must be
+    mutually comparable.
+
+    Attributes:
+        head (SkipNode): A sentinel whose links on every level point to the first node.
+        level (int): The number of levels currently in use.
+        counter (int): The number of keys in the list.
+    """
+
+    def __init__(self, max_level: int = MAX_LEVEL, p: float = P, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            max_level (int): The most levels a node may have. 32 levels at p=0.25 cover
+                far more keys than fit in memory.
+            p (float): The probability of promoting a node to the next level.
+            seed (Optional[int]): Seeds the level generator, for reproducible layouts.
+        """
+        self.max_level: int = max_level
+        self.p: float = p
+        self.random = random.Random(seed).random
+        self.head: SkipNode = self._new_node(None, None, max_level)
+        self.level: int = 1
+        self.counter: int = 0
+
+    def _new_node(self, key: Any, value: Any, level: int) -> SkipNode:
+        return SkipNode(key, value, level)
+
+    def _random_level(self) -> int:
+        level, rand, p = 1, self.random, self.p
+        while level < self.max_level and rand() < p:
+            level += 1
+        return level
+
+    def _predecessors(self, key: Any) -> List[SkipNode]:
+        """
+        Returns, for every level, the last node whose key is less than ``key``.
+        """
+        update = [self.head] * self.max_level
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.next[i]
+            while following is not None and following.key < key:
+                node, following = following, following.next[i]
+            update[i] = node
+        return update
+
+    def __len__(self) -> int:
+        return self.counter
+
+    def size(self) -> int:
+        """
+        Returns the number of keys in the skip list.
+        """
+        return self.counter
+
+    def __contains__(self, key: Any) -> bool:
+        return self.search(key) is not None
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        """
+        Iterates over the keys in ascending order.
+        """
+        for node in self._nodes_from(self.head.next[0]):
+            yield node.key
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(key) for key in self)}]"
+
+    def _nodes_from(self, node: Optional[SkipNode]) -> Generator[SkipNode, None, None]:
+        while node is not None:
+            yield node
+            node = node.next[0]
+
+    def items(self) -> Generator[Tuple[Any, Any], None, None]:
+        """
+        Iterates over (key, value) pairs in ascending key order.
+        """
+        for node in self._nodes_from(self.head.next[0]):
+            yield node.key, node.value
+
+    def search(self, key: Any) -> Optional[SkipNode]:
+        """
+        Finds the node holding a key.
+
+        Returns:
+            Optional[SkipNode]: The node, or None if the key is not in the list.
+        """
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.next[i]
+            while following is not None and following.key < key:
+                node, following = following, following.next[i]
+        node = node.next[0]
+        return node if node is not None and node.key == key else None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value stored for a key, or ``default`` if the key is not in the list.
+        """
+        node = self.search(key)
+        return node.value if node is not None else default
+
+    def insert(self, key: Any, value: Any = None) -> bool:
+        """
+        Inserts a key, or replaces the value of an existing key.
+
+        Args:
+            key: The key to insert.
+            value: The value to associate with the key.
+
+        Returns:
+            bool: True if the key was added, False if an existing value was replaced.
+        """
+        update = self._predecessors(key)
+        node = update[0].next[0]
+        if node is not None and node.key == key:
+            node.value = value
+            return False
+        level = self._random_level()
+        self.level = max(self.level, level)
+        node = self._new_node(key, value, level)
+        for i in range(level):
+            node.next[i] = update[i].next[i]
+            update[i].next[i] = node
+        self.counter += 1
+        return True
+
+    def delete(self, key: Any) -> bool:
+        """
+        Deletes a key, if present.
+
+        Returns:
+            bool: True if the key was removed, False if it was not in the list.
+        """
+        update = self._predecessors(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return False
+        for i in range(len(node.next)):
+            update[i].next[i] = node.next[i]
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.counter -= 1
+        return True
+
+    def iter_from(self, key: Any) -> Generator[Tuple[Any, Any], None, None]:
+        """
+        Lazily yields the (key, value) pairs with a key greater than or equal to ``key``,
+        in ascending order.
+
+        Finding the start costs O(log n); each further pair costs O(1).
+        """
+        start = self._predecessors(key)[0].next[0]
+        for node in self._nodes_from(start):
+            yield node.key, node.value
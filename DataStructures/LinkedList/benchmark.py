@@ -0,0 +1,51 @@
+import time
+import tracemalloc
+from typing import Callable, List
+
+from DoublyLinkedList import DoublyLinkedList
+from LinkedList import LinkedList
+
+
+def bytes_per_element(build: Callable[[], object], n: int) -> float:
+    """Return the memory allocated while ``build`` runs, divided by ``n``."""
+    tracemalloc.start()
+    container = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current / n
+
+
+def _fill(container, values: List[int]):
+    insert = container.insert_end
+    for value in values:
+        insert(value)
+    return container
+
+
+def bench_memory(n: int = 1_000_000) -> None:
+    """Report bytes per element of the linked lists, not counting the stored values.
+
+    ``CircularLinkedList`` shares ``Node`` with ``LinkedList`` and is left out because
+    its O(n) insert makes a 1M-element build quadratic.
+    """
+    values = list(range(n))
+    print(f"{'container':<20}{'bytes/elem':>12}{'build s':>10}")
+    for name, build in (
+        ("LinkedList", lambda: _fill(LinkedList(), values)),
+        ("DoublyLinkedList", lambda: _fill(DoublyLinkedList(), values)),
+    ):
+        start = time.perf_counter()
+        per_element = bytes_per_element(build, n)
+        print(f"{name:<20}{per_element:>12.1f}{time.perf_counter() - start:>10.3f}")
+
+
+def main():
+    """
+    Runs the linked list benchmarks.
+    """
+    bench_memory()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import asyncio
+
+from PriorityQueue import Node, PriorityQueue
+
+
+class AsyncPriorityQueue(asyncio.Queue):
+    """
+    An asyncio priority queue with awaitable ``get``/``put`` and ``task_done``/``join``.
+
+    The waiting, bounded-capacity and task-tracking behaviour comes from
+    ``asyncio.Queue``; only its storage hooks are replaced so items are ordered by a
+    ``PriorityQueue``. Items are ``Node`` objects: lower priority values come out
+    first and equal priorities come out in insertion order.
+
+    Like every ``asyncio.Queue`` it is not thread-safe; use ``BlockingPriorityQueue``
+    to share a queue between threads.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = PriorityQueue()
+
+    def _put(self, node: Node) -> None:
+        self._queue.insert(node)
+
+    def _get(self) -> Node:
+        return self._queue.delete()
@@ -0,0 +1,29 @@
+import queue
+
+from PriorityQueue import Node, PriorityQueue
+
+
+class BlockingPriorityQueue(queue.Queue):
+    """
+    A thread-safe priority queue with blocking ``get``/``put`` and ``task_done``/``join``.
+
+    The locking, blocking, bounded-capacity and task-tracking behaviour comes from
+    ``queue.Queue``; only its storage hooks are replaced so items are ordered by a
+    ``PriorityQueue``. Items are ``Node`` objects: lower priority values come out
+    first and equal priorities come out in insertion order.
+
+    ``get`` raises ``queue.Empty`` and ``put`` raises ``queue.Full`` when they give up
+    waiting, exactly as for ``queue.Queue``.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = PriorityQueue()
+
+    def _qsize(self) -> int:
+        return self.queue.size()
+
+    def _put(self, node: Node) -> None:
+        self.queue.insert(node)
+
+    def _get(self) -> Node:
+        return self.queue.delete()
@@ -0,0 +1,193 @@
+import itertools
+from typing import Dict, List, Optional
+
+from PriorityQueue import Node
+
+
+class IndexedPriorityQueue:
+    """
+    A priority queue whose entries can be re-prioritised or removed after insertion.
+
+    ``insert`` returns the inserted ``Node``, which serves as the handle for later
+    calls. The queue is a binary heap of ``[(priority, sequence), node]`` entries plus a
+    dictionary from each node to its current heap position, so a node can be found
+    in O(1) and moved in O(log n). As in ``PriorityQueue``, lower priority values
+    come first and equal priorities leave in insertion order.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty indexed priority queue.
+        """
+        self.heap: List[list] = []
+        self.position: Dict[Node, int] = {}
+        self._sequence = itertools.count()
+
+    def __contains__(self, node: Node) -> bool:
+        return node in self.position
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Moves the entry at ``index`` towards the root until its parent is smaller.
+        """
+        heap, position = self.heap, self.position
+        entry = heap[index]
+        key = entry[0]
+        while index > 0:
+            parent = (index - 1) // 2
+            if key >= heap[parent][0]:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Moves the entry at ``index`` towards the leaves until both children are larger.
+        """
+        heap, position = self.heap, self.position
+        n = len(heap)
+        entry = heap[index]
+        key = entry[0]
+        while True:
+            child = 2 * index + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if key <= heap[child][0]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def _remove_at(self, index: int) -> Node:
+        """
+        Removes the entry at ``index`` by moving the last entry into its place.
+        """
+        heap = self.heap
+        node = heap[index][1]
+        del self.position[node]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._sift_up(index)
+            self._sift_down(self.position[last[1]])
+        return node
+
+    def insert(self, node: Node) -> Node:
+        """
+        Inserts a node into the queue.
+
+        Args:
+            node (Node): The node to insert. It must not already be queued.
+
+        Returns:
+            Node: The node itself, to be used as the handle for later updates.
+
+        Raises:
+            ValueError: If the node is already in the queue.
+        """
+        if node in self.position:
+            raise ValueError("Node is already in the queue.")
+        self.heap.append([(node.priority, next(self._sequence)), node])
+        self._sift_up(len(self.heap) - 1)
+        return node
+
+    def delete(self) -> Optional[Node]:
+        """
+        Removes and returns the highest priority node from the queue.
+
+        Returns:
+            Optional[Node]: The node with the highest priority, or None if the queue is empty.
+        """
+        return self._remove_at(0) if self.heap else None
+
+    def peek(self) -> Optional[Node]:
+        """
+        Returns the highest priority node without removing it.
+
+        Returns:
+            Optional[Node]: The node with the highest priority, or None if the queue is empty.
+        """
+        return self.heap[0][1] if self.heap else None
+
+    def contains(self, node: Node) -> bool:
+        """
+        Checks whether a node is currently queued.
+        """
+        return node in self.position
+
+    def update_priority(self, node: Node, priority: int) -> None:
+        """
+        Changes the priority of a queued node in either direction.
+
+        The node keeps its original insertion order among nodes of equal priority.
+
+        Args:
+            node (Node): The handle returned by ``insert``.
+            priority (int): The new priority.
+
+        Raises:
+            KeyError: If the node is not in the queue.
+        """
+        index = self.position[node]
+        entry = self.heap[index]
+        old_priority, sequence = entry[0]
+        entry[0] = (priority, sequence)
+        node.priority = priority
+        if priority < old_priority:
+            self._sift_up(index)
+        elif priority > old_priority:
+            self._sift_down(index)
+
+    def decrease_key(self, node: Node, priority: int) -> None:
+        """
+        Lowers the priority value of a queued node, moving it towards the front.
+
+        Args:
+            node (Node): The handle returned by ``insert``.
+            priority (int): The new priority, which must not exceed the current one.
+
+        Raises:
+            KeyError: If the node is not in the queue.
+            ValueError: If the new priority is greater than the current one.
+        """
+        if priority > self.heap[self.position[node]][0][0]:
+            raise ValueError("decrease_key cannot increase the priority value.")
+        self.update_priority(node, priority)
+
+    def remove(self, node: Node) -> Node:
+        """
+        Removes a node from anywhere in the queue.
+
+        Args:
+            node (Node): The handle returned by ``insert``.
+
+        Returns:
+            Node: The removed node.
+
+        Raises:
+            KeyError: If the node is not in the queue.
+        """
+        return self._remove_at(self.position[node])
+
+    def show(self) -> None:
+        """
+        Prints each element of the priority queue, in dequeue order, along with its priority.
+        """
+        for (priority, _), node in sorted(self.heap, key=lambda entry: entry[0]):
+            print(f"{node.info} - {priority}")
+
+    def size(self) -> int:
+        """
+        Returns the number of nodes in the priority queue.
+
+        Returns:
+            int: The size of the queue.
+        """
+        return len(self.heap)
@@ -1,4 +1,13 @@
-from typing import List, Optional
+import itertools
+import os
+import sys
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_HEAP_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Heap"))
+if _HEAP_DIR not in sys.path:
+    sys.path.append(_HEAP_DIR)
+
+from Heap import Heap
 
 
 class Node:
@@ -10,6 +19,8 @@ class Node:
         priority: The priority of the node, used to determine its position in the priority queue.
     """
 
+    __slots__ = ("info", "priority")
+
     def __init__(self, info: str, priority: int) -> None:
         self.info: str = info
         self.priority: int = priority
@@ -17,43 +28,65 @@ class Node:
 
 class PriorityQueue:
     """
-    Implements a priority queue using a list, where nodes are inserted based on their priority.
-    
-    The queue is organized in increasing order of priority, meaning lower priority values are at the front.
+    Implements a priority queue on top of a binary heap.
+
+    Lower priority values are dequeued first. Nodes with equal priority are dequeued
+    in the order they were inserted: every entry is stored as a
+    ``(priority, sequence, node)`` tuple, where the sequence number comes from an
+    increasing counter and breaks ties without ever comparing the nodes themselves.
+    Insertion and removal are O(log n).
     """
 
     def __init__(self) -> None:
         """
         Initializes an empty priority queue.
         """
-        self.queue: List[Node] = []
+        self.heap: Heap[Tuple[int, int, Node]] = Heap()
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __iter__(self) -> Iterator[Node]:
+        """
+        Iterates over the queued nodes in dequeue order, using ``queue``.
+        """
+        return iter(self.queue)
+
+    @property
+    def queue(self) -> Tuple[Node, ...]:
+        """
+        Returns a snapshot of the queued nodes in dequeue order. Building it sorts the heap, so it is O(n log n).
+
+        ``queue`` used to be the underlying list. Mutating it (``pq.queue.append(node)``,
+        ``pq.queue.pop(0)``) is no longer supported, and the tuple makes such calls fail
+        instead of being silently lost. Use ``insert`` and ``delete`` to change the queue,
+        and ``len(pq)``, iteration or ``peek`` to read it.
+        """
+        return tuple(entry[2] for entry in sorted(self.heap))
 
     def insert(self, node: Node) -> bool:
         """
-        Inserts a new node into the priority queue in its correct position based on priority.
-        
+        Inserts a new node into the priority queue.
+
         Args:
             node (Node): The node to be inserted into the queue.
-        
+
         Returns:
-            bool: True if the node was inserted, False otherwise.
-        """
-        # If queue is empty, add the new node directly.
-        if self.size() == 0:
-            self.queue.append(node)
-            return True
-        
-        # Traverse the queue to find the right place for the new node.
-        for x in range(self.size()):
-            if node.priority < self.queue[x].priority:
-                self.queue.insert(x, node)
-                return True
-            elif x == (self.size() - 1):
-                # If we have traversed the complete queue, add new node at the end.
-                self.queue.append(node)
-                return True
-        
-        return False  # This line is theoretically unreachable.
+            bool: True once the node has been inserted.
+        """
+        self.heap.push((node.priority, next(self._sequence), node))
+        return True
+
+    def insert_many(self, nodes: Iterable[Node]) -> None:
+        """
+        Inserts several nodes, preserving their relative order among equal priorities.
+
+        Args:
+            nodes (Iterable[Node]): The nodes to insert.
+        """
+        sequence = self._sequence
+        self.heap.push_many((node.priority, next(sequence), node) for node in nodes)
 
     def delete(self) -> Optional[Node]:
         """
@@ -62,7 +95,30 @@ class PriorityQueue:
         Returns:
             Optional[Node]: The node with the highest priority, or None if the queue is empty.
         """
-        return self.queue.pop(0) if self.queue else None
+        return self.heap.pop()[2] if len(self.heap) else None
+
+    def peek(self) -> Optional[Node]:
+        """
+        Returns the highest priority node without removing it.
+
+        Returns:
+            Optional[Node]: The node with the highest priority, or None if the queue is empty.
+        """
+        return self.heap.findMin()[2] if len(self.heap) else None
+
+    def drain(self, n: Optional[int] = None) -> List[Node]:
+        """
+        Removes and returns up to ``n`` nodes in priority order.
+
+        Args:
+            n (Optional[int]): The maximum number of nodes to remove. None removes every node.
+
+        Returns:
+            List[Node]: The removed nodes, highest priority first.
+        """
+        count = len(self.heap) if n is None else min(n, len(self.heap))
+        pop = self.heap.pop
+        return [pop()[2] for _ in range(count)]
 
     def show(self) -> None:
         """
@@ -78,4 +134,4 @@ class PriorityQueue:
         Returns:
             int: The size of the queue.
         """
-        return len(self.queue)
\ No newline at end of file
+        return len(self.heap)
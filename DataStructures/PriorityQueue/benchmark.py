@@ -0,0 +1,105 @@
+import asyncio
+import random
+import threading
+import time
+import tracemalloc
+
+from AsyncPriorityQueue import AsyncPriorityQueue
+from BlockingPriorityQueue import BlockingPriorityQueue
+from IndexedPriorityQueue import IndexedPriorityQueue
+from PriorityQueue import Node, PriorityQueue
+
+
+def bench_threads(producers: int = 4, consumers: int = 4, items: int = 50_000, maxsize: int = 1_000) -> None:
+    """Measure items per second through a bounded BlockingPriorityQueue shared by producer and consumer threads."""
+    q = BlockingPriorityQueue(maxsize)
+    per_producer = items // producers
+
+    def produce(seed: int) -> None:
+        rng = random.Random(seed)
+        for i in range(per_producer):
+            q.put(Node(str(i), rng.randint(0, 100)))
+
+    def consume() -> None:
+        while True:
+            node = q.get()
+            q.task_done()
+            if node.info is None:
+                return
+
+    threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    threads += [threading.Thread(target=produce, args=(seed,)) for seed in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[consumers:]:
+        thread.join()
+    for _ in range(consumers):
+        q.put(Node(None, float("inf")))
+    q.join()
+    elapsed = time.perf_counter() - start
+    print(f"threads  {producers}P/{consumers}C: {producers * per_producer / elapsed:>10.0f} items/s")
+
+
+def bench_asyncio(producers: int = 4, consumers: int = 4, items: int = 50_000, maxsize: int = 1_000) -> None:
+    """Measure items per second through a bounded AsyncPriorityQueue shared by producer and consumer tasks."""
+    per_producer = items // producers
+
+    async def run() -> float:
+        q = AsyncPriorityQueue(maxsize)
+
+        async def produce(seed: int) -> None:
+            rng = random.Random(seed)
+            for i in range(per_producer):
+                await q.put(Node(str(i), rng.randint(0, 100)))
+
+        async def consume() -> None:
+            while True:
+                await q.get()
+                q.task_done()
+
+        start = time.perf_counter()
+        workers = [asyncio.create_task(consume()) for _ in range(consumers)]
+        await asyncio.gather(*(produce(seed) for seed in range(producers)))
+        await q.join()
+        elapsed = time.perf_counter() - start
+        for worker in workers:
+            worker.cancel()
+        return elapsed
+
+    elapsed = asyncio.run(run())
+    print(f"asyncio  {producers}P/{consumers}C: {producers * per_producer / elapsed:>10.0f} items/s")
+
+
+def bench_memory(n: int = 1_000_000) -> None:
+    """Report bytes per element of the priority queues, counting their nodes but not the payloads."""
+    rng = random.Random(0)
+    infos = [str(i) for i in range(n)]
+    priorities = [rng.randint(0, 100) for _ in range(n)]
+    print(f"{'queue':<24}{'bytes/elem':>12}{'build s':>10}")
+    for factory in (PriorityQueue, IndexedPriorityQueue):
+        tracemalloc.start()
+        start = time.perf_counter()
+        q = factory()
+        for info, priority in zip(infos, priorities):
+            q.insert(Node(info, priority))
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del q
+        print(f"{factory.__name__:<24}{current / n:>12.1f}{elapsed:>10.3f}")
+
+
+def main():
+    """
+    Runs the producer/consumer throughput benchmarks and the memory benchmark.
+    """
+    for workers in (1, 2, 4, 8):
+        bench_threads(workers, workers)
+    for workers in (1, 2, 4, 8):
+        bench_asyncio(workers, workers)
+    bench_memory()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+from typing import Any, Generator, Optional, Tuple
+
+from BST import Tree, TreeNode
+
+
+class AVLNode(TreeNode):
+    """A binary tree node that also stores a value and the height and size of its subtree."""
+
+    __slots__ = ("value", "height", "size")
+
+    def __init__(self, val: int, value: Any = None) -> None:
+        super().__init__(val)
+        self.value: Any = value
+        self.height: int = 1
+        self.size: int = 1
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node else 0
+
+
+def _size(node: Optional[AVLNode]) -> int:
+    return node.size if node else 0
+
+
+def _update(node: AVLNode) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node: AVLNode) -> AVLNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: AVLNode) -> AVLNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: AVLNode) -> AVLNode:
+    """
+    Restores the AVL balance of a node whose children differ in height by at most two.
+    """
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree(Tree):
+    """
+    Implements a self-balancing binary search tree (AVL tree) used as an ordered map.
+
+    Keys are unique and every node stores a value alongside its key. The heights of the
+    two subtrees of any node differ by at most one, so the tree height stays O(log n)
+    and every operation below runs in O(log n). ``is_bst`` from ``Tree`` holds after
+    every operation.
+
+    Every node also records the size of its subtree, which rotations keep up to date.
+    That makes it an order-statistics tree: ``rank``, ``select`` and ``count_range``
+    descend a single root-to-leaf path instead of walking the tree.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: int) -> bool:
+        return self.search(key) is not None
+
+    def __iter__(self) -> Generator[int, None, None]:
+        """
+        Iterates over the keys in ascending order.
+        """
+        for node in self.inorder_nodes():
+            yield node.val
+
+    def items(self) -> Generator[Tuple[int, Any], None, None]:
+        """
+        Iterates over (key, value) pairs in ascending key order.
+        """
+        for node in self.inorder_nodes():
+            yield node.val, node.value
+
+    def insert(self, key: int, value: Any = None) -> Optional[TreeNode]:
+        """
+        Inserts a key, or replaces the value of an existing key.
+
+        Args:
+            key (int): The key to insert.
+            value (Any): The value to associate with the key.
+
+        Returns:
+            TreeNode: The root of the tree after insertion.
+        """
+        def insert_at(node: Optional[AVLNode]) -> AVLNode:
+            if node is None:
+                self.count += 1
+                return AVLNode(key, value)
+            if key < node.val:
+                node.left = insert_at(node.left)
+            elif key > node.val:
+                node.right = insert_at(node.right)
+            else:
+                node.value = value
+                return node
+            return _rebalance(node)
+
+        self.root = insert_at(self.root)
+        return self.root
+
+    def delete(self, key: int) -> Optional[TreeNode]:
+        """
+        Deletes the node with the specified key, if present.
+
+        Args:
+            key (int): The key to delete.
+
+        Returns:
+            TreeNode: The root of the tree after deletion.
+        """
+        def delete_min(node: AVLNode) -> Tuple[Optional[AVLNode], AVLNode]:
+            if node.left is None:
+                return node.right, node
+            node.left, minimum = delete_min(node.left)
+            return _rebalance(node), minimum
+
+        def delete_at(node: Optional[AVLNode]) -> Optional[AVLNode]:
+            if node is None:
+                return None
+            if key < node.val:
+                node.left = delete_at(node.left)
+            elif key > node.val:
+                node.right = delete_at(node.right)
+            else:
+                self.count -= 1
+                if node.left is None:
+                    return node.right
+                if node.right is None:
+                    return node.left
+                right, successor = delete_min(node.right)
+                successor.left, successor.right = node.left, right
+                node = successor
+            return _rebalance(node)
+
+        self.root = delete_at(self.root)
+        return self.root
+
+    def delete_deepest(self, d_node: AVLNode) -> None:
+        """
+        Deletes the key of ``d_node`` through ``delete``.
+
+        The inherited version unlinks the node directly, which would leave the count,
+        heights and subtree sizes stale and could break the AVL balance.
+
+        Args:
+            d_node (AVLNode): The node whose key is deleted.
+        """
+        self.delete(d_node.val)
+
+    def search(self, key: int) -> Optional[AVLNode]:
+        """
+        Finds the node holding a key.
+
+        Returns:
+            Optional[AVLNode]: The node, or None if the key is not in the tree.
+        """
+        node = self.root
+        while node and node.val != key:
+            node = node.left if key < node.val else node.right
+        return node
+
+    def get(self, key: int, default: Any = None) -> Any:
+        """
+        Returns the value stored for a key, or ``default`` if the key is not in the tree.
+        """
+        node = self.search(key)
+        return node.value if node else default
+
+    def min(self) -> Optional[AVLNode]:
+        """
+        Returns the node with the smallest key, or None if the tree is empty.
+        """
+        node = self.root
+        while node and node.left:
+            node = node.left
+        return node
+
+    def max(self) -> Optional[AVLNode]:
+        """
+        Returns the node with the largest key, or None if the tree is empty.
+        """
+        node = self.root
+        while node and node.right:
+            node = node.right
+        return node
+
+    def floor(self, key: int) -> Optional[AVLNode]:
+        """
+        Returns the node with the largest key less than or equal to ``key``.
+        """
+        node, best = self.root, None
+        while node:
+            if node.val == key:
+                return node
+            if node.val < key:
+                best, node = node, node.right
+            else:
+                node = node.left
+        return best
+
+    def ceiling(self, key: int) -> Optional[AVLNode]:
+        """
+        Returns the node with the smallest key greater than or equal to ``key``.
+        """
+        node, best = self.root, None
+        while node:
+            if node.val == key:
+                return node
+            if node.val > key:
+                best, node = node, node.left
+            else:
+                node = node.right
+        return best
+
+    def predecessor(self, key: int) -> Optional[AVLNode]:
+        """
+        Returns the node with the largest key strictly less than ``key``.
+        """
+        node, best = self.root, None
+        while node:
+            if node.val < key:
+                best, node = node, node.right
+            else:
+                node = node.left
+        return best
+
+    def successor(self, key: int) -> Optional[AVLNode]:
+        """
+        Returns the node with the smallest key strictly greater than ``key``.
+        """
+        node, best = self.root, None
+        while node:
+            if node.val > key:
+                best, node = node, node.left
+            else:
+                node = node.right
+        return best
+
+    def rank(self, key: int) -> int:
+        """
+        Returns the number of keys strictly less than ``key``.
+        """
+        node, rank = self.root, 0
+        while node:
+            if key <= node.val:
+                node = node.left
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, k: int) -> AVLNode:
+        """
+        Returns the node with the k-th smallest key, counting from 0.
+
+        Raises:
+            IndexError: If k is not in the range [0, len(tree)).
+        """
+        if not 0 <= k < self.count:
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node
+            else:
+                k -= left + 1
+                node = node.right
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """
+        Returns the number of keys in the closed range [lo, hi].
+        """
+        if hi < lo:
+            return 0
+        node, at_most_hi = self.root, 0
+        while node:
+            if hi < node.val:
+                node = node.left
+            else:
+                at_most_hi += _size(node.left) + 1
+                node = node.right
+        return at_most_hi - self.rank(lo)
+
+    def iter_range(self, lo: int, hi: int) -> Generator[int, None, None]:
+        """
+        Lazily yields the keys in the closed range [lo, hi] in ascending order.
+
+        Only the path to ``lo`` is built up front; each further key costs O(1) amortized.
+        """
+        stack = []
+        node = self.root
+        while node:
+            if node.val >= lo:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if node.val > hi:
+                return
+            yield node.val
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
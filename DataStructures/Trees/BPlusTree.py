@@ -0,0 +1,414 @@
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Generator, Iterable, List, Optional, Tuple
+
+_MAGIC = b"BPTREE01"
+# magic, page size, root page, page count, first leaf page, number of keys
+_HEADER = struct.Struct("<8sIQQQQ")
+# page type, number of keys, next leaf page (0 for none or for internal pages)
+_NODE_HEADER = struct.Struct("<B3xIQ")
+_LEAF, _INTERNAL = 1, 2
+
+
+class BPlusPage:
+    """
+    A decoded page of a ``BPlusTree``.
+
+    Attributes:
+        page_id (int): The page number in the file.
+        leaf (bool): Whether the page is a leaf.
+        keys (List[int]): The sorted keys stored in the page.
+        values (List[int]): The values for a leaf, or the child page numbers for an internal page.
+        next (int): The page number of the next leaf, or 0 if there is none.
+        dirty (bool): Whether the page has changes not yet written to the file.
+    """
+
+    def __init__(self, page_id: int, leaf: bool, keys: List[int], values: List[int], next: int = 0) -> None:
+        self.page_id: int = page_id
+        self.leaf: bool = leaf
+        self.keys: List[int] = keys
+        self.values: List[int] = values
+        self.next: int = next
+        self.dirty: bool = False
+
+
+class BPlusTree:
+    """
+    A B+tree mapping 64-bit integer keys to 64-bit integer values, stored in a memory-mapped file.
+
+    The file is a sequence of fixed-size pages. Page 0 is a header; every other page is
+    a leaf holding sorted keys and values, or an internal page holding separator keys
+    and child page numbers. Leaves are linked in key order, so range scans never go
+    back up the tree. Opening an existing file only maps it and reads the header.
+
+    Decoded pages live in an LRU page cache. Modified pages are marked dirty and are
+    written back to the mapping when they are evicted or on ``flush``/``close``. The
+    cache may briefly exceed its capacity by the pages of a single operation.
+
+    Deleting keys never merges pages, so a tree that shrinks a lot keeps its pages.
+    """
+
+    def __init__(self, path: str, page_size: int = 4096, cache_pages: int = 1024) -> None:
+        """
+        Opens the tree stored at ``path``, creating an empty one if the file does not exist.
+
+        Args:
+            path (str): The file holding the tree.
+            page_size (int): The page size in bytes for a new file. An existing file keeps its own.
+            cache_pages (int): The maximum number of decoded pages kept in memory.
+        """
+        if cache_pages < 1:
+            raise ValueError("cache_pages must be at least 1")
+        self.path = path
+        self.cache_pages = cache_pages
+        self._cache: "OrderedDict[int, BPlusPage]" = OrderedDict()
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            header = self._file.read(_HEADER.size)
+            magic, self.page_size, self.root, self.page_count, self.first_leaf, self.count = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                self._file.close()
+                raise ValueError(f"{path} is not a B+tree file.")
+            self._set_capacities()
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+        else:
+            if page_size < 64 or page_size % 16:
+                self._file.close()
+                raise ValueError("page_size must be a multiple of 16 and at least 64")
+            self.page_size = page_size
+            self._set_capacities()
+            self._file.truncate(page_size * 2)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            self.page_count = 1
+            self.count = 0
+            root = self._new_page(leaf=True)
+            self.root = self.first_leaf = root.page_id
+            self.flush()
+
+    def __enter__(self) -> "BPlusTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def _set_capacities(self) -> None:
+        # A leaf stores n keys and n values, an internal page n keys and n + 1 children.
+        self.leaf_capacity = (self.page_size - _NODE_HEADER.size) // 16
+        self.internal_capacity = (self.page_size - _NODE_HEADER.size - 8) // 16
+
+    def _capacity(self, leaf: bool) -> int:
+        return self.leaf_capacity if leaf else self.internal_capacity
+
+    def _read(self, page_id: int) -> BPlusPage:
+        """
+        Decodes a page straight from the mapping.
+        """
+        offset = page_id * self.page_size
+        kind, n, next_leaf = _NODE_HEADER.unpack_from(self._mm, offset)
+        leaf = kind == _LEAF
+        start = offset + _NODE_HEADER.size
+        values_start = start + 8 * self._capacity(leaf)
+        keys = array("q", self._mm[start:start + 8 * n]).tolist()
+        values = array("q", self._mm[values_start:values_start + 8 * (n if leaf else n + 1)]).tolist()
+        return BPlusPage(page_id, leaf, keys, values, next_leaf)
+
+    def _write(self, page: BPlusPage) -> None:
+        """
+        Encodes a page into the mapping.
+        """
+        offset = page.page_id * self.page_size
+        capacity = self._capacity(page.leaf)
+        _NODE_HEADER.pack_into(self._mm, offset, _LEAF if page.leaf else _INTERNAL, len(page.keys), page.next)
+        start = offset + _NODE_HEADER.size
+        keys = array("q", page.keys).tobytes()
+        values = array("q", page.values).tobytes()
+        self._mm[start:start + len(keys)] = keys
+        values_start = start + 8 * capacity
+        self._mm[values_start:values_start + len(values)] = values
+        page.dirty = False
+
+    def _page(self, page_id: int) -> BPlusPage:
+        """
+        Returns a page from the cache, reading it from the mapping on a miss.
+        """
+        page = self._cache.get(page_id)
+        if page is None:
+            page = self._read(page_id)
+            self._cache[page_id] = page
+        else:
+            self._cache.move_to_end(page_id)
+        return page
+
+    def _trim(self) -> None:
+        """
+        Evicts least recently used pages, writing dirty ones back, until the cache fits.
+        """
+        while len(self._cache) > self.cache_pages:
+            _, page = self._cache.popitem(last=False)
+            if page.dirty:
+                self._write(page)
+
+    def _allocate(self) -> int:
+        """
+        Reserves a new page number, growing the file and the mapping when needed.
+        """
+        page_id = self.page_count
+        self.page_count += 1
+        needed = self.page_count * self.page_size
+        if needed > len(self._mm):
+            # Grow geometrically, but by at most 64 MiB at a time.
+            size = max(needed, len(self._mm) + min(len(self._mm), 1 << 26))
+            self._mm.flush()
+            self._mm.close()
+            self._file.truncate(size)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+        return page_id
+
+    def _new_page(self, leaf: bool, keys: Optional[List[int]] = None, values: Optional[List[int]] = None,
+                  next: int = 0) -> BPlusPage:
+        page = BPlusPage(self._allocate(), leaf, keys or [], values or [], next)
+        page.dirty = True
+        self._cache[page.page_id] = page
+        return page
+
+    def flush(self) -> None:
+        """
+        Writes every dirty page and the header to the file.
+        """
+        for page in self._cache.values():
+            if page.dirty:
+                self._write(page)
+        _HEADER.pack_into(self._mm, 0, _MAGIC, self.page_size, self.root, self.page_count,
+                          self.first_leaf, self.count)
+        self._mm.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the tree and releases the mapping and the file.
+        """
+        if self._mm.closed:
+            return
+        self.flush()
+        self._cache.clear()
+        self._mm.close()
+        self._file.close()
+
+    def _find_leaf(self, key: int, path: Optional[List[Tuple[BPlusPage, int]]] = None) -> BPlusPage:
+        page = self._page(self.root)
+        while not page.leaf:
+            index = bisect_right(page.keys, key)
+            if path is not None:
+                path.append((page, index))
+            page = self._page(page.values[index])
+        return page
+
+    def get(self, key: int, default: Optional[int] = None) -> Optional[int]:
+        """
+        Returns the value stored for a key, or ``default`` if the key is not in the tree.
+        """
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        found = index < len(leaf.keys) and leaf.keys[index] == key
+        self._trim()
+        return leaf.values[index] if found else default
+
+    def insert(self, key: int, value: int) -> None:
+        """
+        Inserts a key, or replaces the value of an existing key.
+
+        Args:
+            key (int): A signed 64-bit integer key.
+            value (int): A signed 64-bit integer value.
+        """
+        path: List[Tuple[BPlusPage, int]] = []
+        leaf = self._find_leaf(key, path)
+        index = bisect_left(leaf.keys, key)
+        leaf.dirty = True
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.values[index] = value
+            self._trim()
+            return
+        leaf.keys.insert(index, key)
+        leaf.values.insert(index, value)
+        self.count += 1
+
+        if len(leaf.keys) > self.leaf_capacity:
+            middle = len(leaf.keys) // 2
+            right = self._new_page(True, leaf.keys[middle:], leaf.values[middle:], leaf.next)
+            del leaf.keys[middle:], leaf.values[middle:]
+            leaf.next = right.page_id
+            separator, right_id = right.keys[0], right.page_id
+
+            while path:
+                parent, index = path.pop()
+                parent.keys.insert(index, separator)
+                parent.values.insert(index + 1, right_id)
+                parent.dirty = True
+                if len(parent.keys) <= self.internal_capacity:
+                    break
+                middle = len(parent.keys) // 2
+                separator = parent.keys[middle]
+                right = self._new_page(False, parent.keys[middle + 1:], parent.values[middle + 1:])
+                del parent.keys[middle:], parent.values[middle + 1:]
+                right_id = right.page_id
+            else:
+                root = self._new_page(False, [separator], [self.root, right_id])
+                self.root = root.page_id
+        self._trim()
+
+    def delete(self, key: int) -> bool:
+        """
+        Removes a key from its leaf. Pages are not merged.
+
+        Returns:
+            bool: True if the key was removed, False if it was not in the tree.
+        """
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        found = index < len(leaf.keys) and leaf.keys[index] == key
+        if found:
+            del leaf.keys[index], leaf.values[index]
+            leaf.dirty = True
+            self.count -= 1
+        self._trim()
+        return found
+
+    def range(self, lo: Optional[int] = None, hi: Optional[int] = None) -> Generator[Tuple[int, int], None, None]:
+        """
+        Lazily yields the (key, value) pairs with lo <= key <= hi in ascending key order.
+
+        Either bound may be None to leave that side open. The tree must not be modified
+        while the scan is running.
+
+        Leaves after the first are decoded straight from the mapping, unless the cache
+        already holds them, and are not added to the cache. A long scan therefore does
+        not push the working set out of it.
+        """
+        if lo is None:
+            page = self._page(self.first_leaf)
+            index = 0
+        else:
+            page = self._find_leaf(lo)
+            index = bisect_left(page.keys, lo)
+        self._trim()
+        while True:
+            keys, values = page.keys, page.values
+            for i in range(index, len(keys)):
+                if hi is not None and keys[i] > hi:
+                    return
+                yield keys[i], values[i]
+            if not page.next:
+                return
+            cached = self._cache.get(page.next)
+            page = cached if cached is not None else self._read(page.next)
+            index = 0
+
+    def items(self) -> Generator[Tuple[int, int], None, None]:
+        """
+        Yields every (key, value) pair in ascending key order.
+        """
+        return self.range()
+
+    def bulk_load(self, pairs: Iterable[Tuple[int, int]], fill: float = 1.0) -> None:
+        """
+        Builds the tree bottom-up from pairs sorted by strictly increasing key.
+
+        Pages are written straight to the file level by level without going through
+        the page cache, which is far faster than repeated inserts for large inputs.
+
+        Args:
+            pairs (Iterable[Tuple[int, int]]): The (key, value) pairs in ascending key order.
+            fill (float): The fraction of each page to fill, leaving room for later inserts.
+
+        Raises:
+            ValueError: If the tree is not empty or the keys are not strictly increasing.
+                Any error after loading has begun, including one raised by ``pairs``
+                or a key that does not fit in 64 bits, leaves the tree empty.
+        """
+        if self.count:
+            raise ValueError("bulk_load requires an empty tree.")
+        if not 0 < fill <= 1:
+            raise ValueError("fill must be in (0, 1]")
+        leaf_size = max(1, int(self.leaf_capacity * fill))
+        internal_size = max(2, int((self.internal_capacity + 1) * fill))
+
+        self._cache.clear()
+        page_count = self.page_count
+        try:
+            self.count = self._load(pairs, leaf_size, internal_size)
+            self.flush()
+        except BaseException:
+            # Pages already written are unreachable once the first leaf is empty again.
+            self._write(BPlusPage(self.first_leaf, True, [], []))
+            self.root = self.first_leaf
+            self.page_count = page_count
+            self.count = 0
+            self.flush()
+            raise
+
+    def _load(self, pairs: Iterable[Tuple[int, int]], leaf_size: int, internal_size: int) -> int:
+        """
+        Writes the leaves and then the internal levels of ``bulk_load``, and returns the number of keys.
+
+        Each page is written only once its successor is full or the input ends, so the
+        last two pages of a level can share their entries evenly instead of leaving an
+        almost empty page at the end.
+        """
+        level: List[Tuple[int, int]] = []  # (smallest key, page id) of each page on the level
+        held: Optional[BPlusPage] = None
+        page = BPlusPage(self.first_leaf, True, [], [])  # Reuse the empty root leaf as the first leaf.
+        previous = None
+        count = 0
+        for key, value in pairs:
+            if previous is not None and key <= previous:
+                raise ValueError("bulk_load requires strictly increasing keys.")
+            previous = key
+            if len(page.keys) == leaf_size:
+                if held is not None:
+                    self._write(held)
+                    level.append((held.keys[0], held.page_id))
+                page.next = self._allocate()
+                held, page = page, BPlusPage(page.next, True, [], [])
+            page.keys.append(key)
+            page.values.append(value)
+            count += 1
+        if held is not None:
+            if len(page.keys) < (leaf_size + 1) // 2:
+                moved = (len(held.keys) - len(page.keys)) // 2
+                page.keys[:0], page.values[:0] = held.keys[-moved:], held.values[-moved:]
+                del held.keys[-moved:], held.values[-moved:]
+            self._write(held)
+            level.append((held.keys[0], held.page_id))
+        self._write(page)
+        level.append((page.keys[0] if page.keys else 0, page.page_id))
+
+        while len(level) > 1:
+            bounds = list(range(0, len(level), internal_size)) + [len(level)]
+            if len(bounds) > 2 and bounds[-1] - bounds[-2] < max(2, (internal_size + 1) // 2):
+                # Share the last two groups evenly; a page needs at least two children.
+                total = bounds[-1] - bounds[-3]
+                if total < 4:
+                    del bounds[-2]
+                else:
+                    bounds[-2] = bounds[-3] + total - total // 2
+            parents: List[Tuple[int, int]] = []
+            for lo, hi in zip(bounds, bounds[1:]):
+                group = level[lo:hi]
+                page = BPlusPage(self._allocate(), False, [key for key, _ in group[1:]],
+                                 [page_id for _, page_id in group])
+                self._write(page)
+                parents.append((group[0][0], page.page_id))
+            level = parents
+        self.root = level[0][1]
+        return count
@@ -1,8 +1,11 @@
-from typing import Optional, List
+from collections import deque
+from typing import Generator, List, Optional
 
 class TreeNode:
     """Represents a node in a binary tree."""
 
+    __slots__ = ("val", "left", "right")
+
     def __init__(self, val: int = 0, left: 'TreeNode' = None, right: 'TreeNode' = None) -> None:
         self.val: int = val
         self.left: Optional[TreeNode] = left
@@ -29,9 +32,9 @@ class Tree:
             self.root = TreeNode(key)
             return self.root
 
-        q: List[TreeNode] = [self.root]
+        q = deque([self.root])
         while q:
-            temp = q.pop(0)
+            temp = q.popleft()
             if not temp.left:
                 temp.left = TreeNode(key)
                 break
@@ -57,10 +60,10 @@ class Tree:
             return None
 
         del_node = None
-        q = [self.root]
+        q = deque([self.root])
 
         while q:
-            temp = q.pop(0)
+            temp = q.popleft()
             if temp.val == key:
                 del_node = temp
             if temp.left:
@@ -81,9 +84,9 @@ class Tree:
         Args:
             d_node (TreeNode): The node to delete.
         """
-        q = [self.root]
+        q = deque([self.root])
         while q:
-            temp = q.pop(0)
+            temp = q.popleft()
             if temp is d_node:
                 temp = None
                 return
@@ -100,6 +103,85 @@ class Tree:
                 else:
                     q.append(temp.left)
 
+    def inorder_nodes(self, node: Optional[TreeNode] = None,
+                      reverse: bool = False) -> Generator[TreeNode, None, None]:
+        """
+        Yields the nodes of a subtree in inorder (or reverse inorder) without recursion.
+
+        An explicit stack holds the path to the current node, so memory is O(height)
+        and arbitrarily deep trees do not hit the recursion limit.
+
+        Args:
+            node (TreeNode): The root of the subtree to traverse. Defaults to the tree root.
+            reverse (bool): Whether to visit right subtrees first, giving descending order in a BST.
+        """
+        node = self.root if node is None else node
+        stack: List[TreeNode] = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
+            yield node
+            node = node.left if reverse else node.right
+
+    def inorder(self) -> Generator[int, None, None]:
+        """
+        Yields the values of the tree in inorder (left, node, right).
+        """
+        for node in self.inorder_nodes():
+            yield node.val
+
+    def reverse_inorder(self) -> Generator[int, None, None]:
+        """
+        Yields the values of the tree in reverse inorder (right, node, left).
+        """
+        for node in self.inorder_nodes(reverse=True):
+            yield node.val
+
+    def preorder(self) -> Generator[int, None, None]:
+        """
+        Yields the values of the tree in preorder (node, left, right).
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.val
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def postorder(self) -> Generator[int, None, None]:
+        """
+        Yields the values of the tree in postorder (left, right, node).
+        """
+        stack: List[TreeNode] = []
+        node, last = self.root, None
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right and top.right is not last:
+                node = top.right
+            else:
+                last = stack.pop()
+                yield last.val
+
+    def level_order(self) -> Generator[int, None, None]:
+        """
+        Yields the values of the tree level by level, left to right.
+        """
+        q = deque([self.root] if self.root else [])
+        while q:
+            node = q.popleft()
+            yield node.val
+            if node.left:
+                q.append(node.left)
+            if node.right:
+                q.append(node.right)
+
     def print_inorder(self, node: Optional[TreeNode]) -> None:
         """
         Prints the nodes of the tree in an inorder traversal.
@@ -108,23 +190,104 @@ class Tree:
             node (TreeNode): The current node to process.
         """
         if node:
-            self.print_inorder(node.left)
-            print(node.val, end=' ')
-            self.print_inorder(node.right)
+            for current in self.inorder_nodes(node):
+                print(current.val, end=' ')
 
     def is_bst(self) -> bool:
         """
         Checks if the tree is a binary search tree (BST).
 
+        Walks the tree in inorder and stops at the first value that is not strictly
+        greater than the one before it.
+
         Returns:
             bool: True if the tree is a BST, False otherwise.
         """
-        def is_bst_util(node: Optional[TreeNode], left: int, right: int) -> bool:
-            if not node:
-                return True
-            if not (left < node.val < right):
+        previous = float('-inf')
+        for node in self.inorder_nodes():
+            if not previous < node.val:
                 return False
-            return (is_bst_util(node.left, left, node.val) and
-                    is_bst_util(node.right, node.val, right))
+            previous = node.val
+        return True
+
+
+class CompleteTree(Tree):
+    """
+    Implements the same complete binary tree as ``Tree``, backed by an array of its nodes.
+
+    The nodes are kept in level order in ``nodes``, so the children of ``nodes[i]`` are
+    ``nodes[2 * i + 1]`` and ``nodes[2 * i + 2]``. The next insertion slot and the
+    deepest node are always at the end of the array, which makes ``insert`` and
+    ``delete_deepest`` O(1) amortized instead of a breadth-first search.
+    """
 
-        return is_bst_util(self.root, float('-inf'), float('inf'))
\ No newline at end of file
+    def __init__(self) -> None:
+        super().__init__()
+        self.nodes: List[TreeNode] = []
+
+    def insert(self, key: int) -> Optional[TreeNode]:
+        """
+        Inserts a new key into the next free slot of the last level.
+
+        Args:
+            key (int): The value to insert into the tree.
+
+        Returns:
+            TreeNode: The root of the tree after insertion.
+        """
+        node = TreeNode(key)
+        index = len(self.nodes)
+        if index == 0:
+            self.root = node
+        else:
+            parent = self.nodes[(index - 1) // 2]
+            if index % 2:
+                parent.left = node
+            else:
+                parent.right = node
+        self.nodes.append(node)
+        return self.root
+
+    def delete(self, key: int) -> Optional[TreeNode]:
+        """
+        Deletes a node with the specified key by moving the deepest node's value into it.
+
+        Finding the key is a linear scan of the array; removing the deepest node is O(1).
+
+        Args:
+            key (int): The value of the node to delete.
+
+        Returns:
+            TreeNode: The root of the tree after deletion.
+        """
+        del_node = None
+        for node in self.nodes:
+            if node.val == key:
+                del_node = node
+        if del_node:
+            deepest = self.nodes[-1]
+            self.delete_deepest(deepest)
+            del_node.val = deepest.val
+        return self.root
+
+    def delete_deepest(self, d_node: Optional[TreeNode] = None) -> None:
+        """
+        Deletes the deepest rightmost node in the tree.
+
+        Args:
+            d_node (TreeNode): The node to delete. It must be the deepest rightmost node; defaults to it.
+        """
+        if not self.nodes:
+            return
+        if d_node is not None and d_node is not self.nodes[-1]:
+            raise ValueError("CompleteTree can only delete its deepest rightmost node.")
+        index = len(self.nodes) - 1
+        self.nodes.pop()
+        if index == 0:
+            self.root = None
+        else:
+            parent = self.nodes[(index - 1) // 2]
+            if index % 2:
+                parent.left = None
+            else:
+                parent.right = None
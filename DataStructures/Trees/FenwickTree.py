@@ -0,0 +1,141 @@
+from typing import Iterable, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up building from an ndarray.
+    np = None
+
+Number = Union[int, float]
+
+
+class FenwickTree:
+    """
+    A Fenwick (binary indexed) tree for prefix and range sums under point updates.
+
+    The tree is a flat list where ``tree[i]`` holds the sum of ``values[i & (i + 1) : i + 1]``.
+    Building is O(n), ``add`` and ``range_sum`` are O(log n). Ranges are half-open:
+    ``range_sum(lo, hi)`` covers indices ``lo`` to ``hi - 1``.
+    """
+
+    def __init__(self, values: Union[Sequence[Number], "np.ndarray"]) -> None:
+        """
+        Builds the tree in O(n) from a list or a NumPy array.
+
+        Args:
+            values: The initial values. A NumPy array is built with one vectorized step per level.
+        """
+        self.tree: List[Number] = self._build(values)
+
+    @staticmethod
+    def _build(values: Union[Sequence[Number], "np.ndarray"]) -> List[Number]:
+        """
+        Adds every node into its parent ``i | (i + 1)``, without the cancellation of prefix-sum differences.
+
+        Nodes are visited by level, the number of trailing one bits of ``i``: a node's
+        children all sit on lower levels, so it is complete before it is added on.
+        Both builds add in this order and agree exactly, also for floats.
+        """
+        n = len(values)
+        if np is not None and isinstance(values, np.ndarray) and (
+                values.dtype.kind in "bif" or (values.dtype.kind == "u" and values.dtype.itemsize < 8)):
+            tree = values.astype(np.float64 if values.dtype.kind == "f" else np.int64)
+            step = 1
+            while step <= n:
+                children = np.arange(step - 1, n - step, 2 * step)
+                tree[children + step] += tree[children]
+                step *= 2
+            return tree.tolist()
+        tree = values.tolist() if np is not None and isinstance(values, np.ndarray) else list(values)
+        step = 1
+        while step <= n:
+            for child in range(step - 1, n - step, 2 * step):
+                tree[child + step] += tree[child]
+            step *= 2
+        return tree
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def add(self, index: int, delta: Number) -> None:
+        """
+        Adds ``delta`` to the value at ``index``.
+        """
+        tree, n = self.tree, len(self.tree)
+        if not 0 <= index < n:
+            raise IndexError("FenwickTree index out of range")
+        while index < n:
+            tree[index] += delta
+            index |= index + 1
+
+    def prefix_sum(self, end: int) -> Number:
+        """
+        Returns the sum of the values at indices ``0`` to ``end - 1``.
+
+        Raises:
+            IndexError: If ``end`` is not between 0 and ``len(self)``.
+        """
+        tree, total = self.tree, 0
+        if not 0 <= end <= len(tree):
+            raise IndexError("FenwickTree index out of range")
+        while end > 0:
+            total += tree[end - 1]
+            end &= end - 1
+        return total
+
+    def range_sum(self, lo: int, hi: int) -> Number:
+        """
+        Returns the sum of the values at indices ``lo`` to ``hi - 1``.
+        """
+        if hi <= lo:
+            return 0
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+    def get(self, index: int) -> Number:
+        """
+        Returns the value at ``index``.
+        """
+        return self.range_sum(index, index + 1)
+
+    def set(self, index: int, value: Number) -> None:
+        """
+        Replaces the value at ``index``.
+        """
+        self.add(index, value - self.get(index))
+
+    def values(self) -> List[Number]:
+        """
+        Recovers the underlying values in O(n).
+        """
+        values = self.tree[:]
+        for i in range(len(values) - 1, -1, -1):
+            parent = i | (i + 1)
+            if parent < len(values):
+                values[parent] -= values[i]
+        return values
+
+    def query_many(self, ranges: Iterable[Tuple[int, int]]) -> List[Number]:
+        """
+        Returns ``range_sum(lo, hi)`` for every (lo, hi) pair.
+        """
+        prefix_sum = self.prefix_sum
+        return [prefix_sum(hi) - prefix_sum(lo) if lo < hi else 0 for lo, hi in ranges]
+
+    def update_many(self, updates: Iterable[Tuple[int, Number]]) -> None:
+        """
+        Applies ``add(index, delta)`` for every (index, delta) pair.
+
+        A batch large enough that n log n individual updates would cost more than a
+        rebuild is applied to the recovered values and the tree is rebuilt in O(n).
+        """
+        updates = list(updates)
+        n = len(self.tree)
+        if len(updates) * max(1, n.bit_length()) <= 2 * n:
+            for index, delta in updates:
+                self.add(index, delta)
+            return
+        values = self.values()
+        for index, delta in updates:
+            if not 0 <= index < n:
+                raise IndexError("FenwickTree index out of range")
+            values[index] += delta
+        self.tree = self._build(values)
@@ -0,0 +1,233 @@
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up building from an ndarray.
+    np = None
+
+Number = Union[int, float]
+
+_OPERATIONS = {
+    "sum": (lambda a, b: a + b, 0),
+    "min": (min, float("inf")),
+    "max": (max, float("-inf")),
+}
+
+
+class SegmentTree:
+    """
+    A segment tree over a flat array with lazy range add and range assign.
+
+    The tree aggregates with ``sum``, ``min`` or ``max``. Nodes live in one list where
+    node ``k`` has children ``2k`` and ``2k + 1`` and the leaves start at ``size``,
+    the next power of two at or above n. Every internal node carries a pending
+    ``(assign, add)`` tag that is pushed to its children only when a query or update
+    needs to go below it. Updates and queries walk bottom-up without recursion and
+    cost O(log n). All ranges are half-open: ``query(lo, hi)`` covers indices ``lo``
+    to ``hi - 1``.
+    """
+
+    def __init__(self, values: Union[Sequence[Number], "np.ndarray"], operation: str = "sum") -> None:
+        """
+        Builds the tree in O(n) from a list or a NumPy array.
+
+        Args:
+            values: The initial values. A NumPy array is built one level at a time with
+                vectorized operations.
+            operation (str): The aggregate, one of ``"sum"``, ``"min"`` or ``"max"``.
+        """
+        if operation not in _OPERATIONS:
+            raise ValueError(f"operation must be one of {sorted(_OPERATIONS)}")
+        self.operation = operation
+        self._combine, self._identity = _OPERATIONS[operation]
+        self.n = n = len(values)
+        self.log = max(1, (n - 1).bit_length())
+        self.size = size = 1 << self.log
+
+        self._length: List[int] = [0] * (2 * size)
+        self._length[size:size + n] = [1] * n
+        for k in range(size - 1, 0, -1):
+            self._length[k] = self._length[2 * k] + self._length[2 * k + 1]
+        self._lazy_assign: List[Optional[Number]] = [None] * size
+        self._lazy_add: List[Number] = [0] * size
+
+        if np is not None and isinstance(values, np.ndarray) and (
+                values.dtype.kind in "bif" or (values.dtype.kind == "u" and values.dtype.itemsize < 8)):
+            self.data: List[Number] = self._build_vectorized(values)
+        else:
+            data = [self._identity] * (2 * size)
+            data[size:size + n] = values.tolist() if np is not None and isinstance(values, np.ndarray) else values
+            combine = self._combine
+            for k in range(size - 1, 0, -1):
+                data[k] = combine(data[2 * k], data[2 * k + 1])
+            self.data = data
+
+    def _build_vectorized(self, values: "np.ndarray") -> List[Number]:
+        """
+        Builds every level with one ufunc call. Integer input stays in int64, so results
+        match the list build exactly. The padding leaves hold the dtype's extreme
+        instead of +-inf and are reset to the identity afterwards.
+        """
+        size, n = self.size, self.n
+        if values.dtype.kind == "f":
+            dtype, padding = np.float64, self._identity
+        else:
+            dtype = np.int64
+            padding = {"sum": 0, "min": np.iinfo(dtype).max, "max": np.iinfo(dtype).min}[self.operation]
+        data = np.full(2 * size, padding, dtype=dtype)
+        data[size:size + n] = values
+        ufunc = {"sum": np.add, "min": np.minimum, "max": np.maximum}[self.operation]
+        level = size
+        while level > 1:
+            data[level // 2:level] = ufunc(data[level:2 * level:2], data[level + 1:2 * level:2])
+            level //= 2
+        result = data.tolist()
+        if padding != self._identity:
+            # On every level the nodes covering only padding form a suffix; slot 0 is unused.
+            result[0] = self._identity
+            level = 1
+            while level <= size:
+                span = size // level
+                first = level + (n + span - 1) // span
+                result[first:2 * level] = [self._identity] * (2 * level - first)
+                level *= 2
+        return result
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _apply(self, k: int, assign: Optional[Number], add: Number) -> None:
+        """
+        Applies an (assign, add) update to the aggregate of node ``k`` and records it in its tag.
+        """
+        length = self._length[k]
+        if not length:
+            return  # Padding beyond n keeps the identity.
+        sum_node = self.operation == "sum"
+        if assign is not None:
+            self.data[k] = assign * length if sum_node else assign
+        if add:
+            self.data[k] += add * length if sum_node else add
+        if k < self.size:
+            if assign is not None:
+                self._lazy_assign[k] = assign
+                self._lazy_add[k] = add
+            else:
+                self._lazy_add[k] += add
+
+    def _push(self, k: int) -> None:
+        """
+        Moves the pending tag of node ``k`` down to its children.
+        """
+        assign, add = self._lazy_assign[k], self._lazy_add[k]
+        if assign is not None or add:
+            self._apply(2 * k, assign, add)
+            self._apply(2 * k + 1, assign, add)
+            self._lazy_assign[k] = None
+            self._lazy_add[k] = 0
+
+    def _pull(self, k: int) -> None:
+        self.data[k] = self._combine(self.data[2 * k], self.data[2 * k + 1])
+
+    def _check_range(self, lo: int, hi: int) -> None:
+        if not 0 <= lo <= hi <= self.n:
+            raise IndexError("SegmentTree range out of bounds")
+
+    def query(self, lo: int, hi: int) -> Number:
+        """
+        Returns the aggregate of the values at indices ``lo`` to ``hi - 1``.
+
+        An empty range returns the identity: 0 for sum, inf for min and -inf for max.
+        """
+        self._check_range(lo, hi)
+        if lo == hi:
+            return self._identity
+        lo += self.size
+        hi += self.size
+        for i in range(self.log, 0, -1):
+            if ((lo >> i) << i) != lo:
+                self._push(lo >> i)
+            if ((hi >> i) << i) != hi:
+                self._push((hi - 1) >> i)
+
+        combine, data = self._combine, self.data
+        left = right = self._identity
+        while lo < hi:
+            if lo & 1:
+                left = combine(left, data[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = combine(data[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return combine(left, right)
+
+    def _update(self, lo: int, hi: int, assign: Optional[Number], add: Number) -> None:
+        self._check_range(lo, hi)
+        if lo == hi:
+            return
+        lo += self.size
+        hi += self.size
+        for i in range(self.log, 0, -1):
+            if ((lo >> i) << i) != lo:
+                self._push(lo >> i)
+            if ((hi >> i) << i) != hi:
+                self._push((hi - 1) >> i)
+
+        left, right = lo, hi
+        while left < right:
+            if left & 1:
+                self._apply(left, assign, add)
+                left += 1
+            if right & 1:
+                right -= 1
+                self._apply(right, assign, add)
+            left >>= 1
+            right >>= 1
+
+        for i in range(1, self.log + 1):
+            if ((lo >> i) << i) != lo:
+                self._pull(lo >> i)
+            if ((hi >> i) << i) != hi:
+                self._pull((hi - 1) >> i)
+
+    def range_add(self, lo: int, hi: int, delta: Number) -> None:
+        """
+        Adds ``delta`` to every value at indices ``lo`` to ``hi - 1``.
+        """
+        self._update(lo, hi, None, delta)
+
+    def range_assign(self, lo: int, hi: int, value: Number) -> None:
+        """
+        Sets every value at indices ``lo`` to ``hi - 1`` to ``value``.
+        """
+        self._update(lo, hi, value, 0)
+
+    def get(self, index: int) -> Number:
+        """
+        Returns the value at ``index``.
+        """
+        return self.query(index, index + 1)
+
+    def set(self, index: int, value: Number) -> None:
+        """
+        Replaces the value at ``index``.
+        """
+        self._update(index, index + 1, value, 0)
+
+    def query_many(self, ranges: Iterable[Tuple[int, int]]) -> List[Number]:
+        """
+        Returns ``query(lo, hi)`` for every (lo, hi) pair.
+        """
+        query = self.query
+        return [query(lo, hi) for lo, hi in ranges]
+
+    def update_many(self, updates: Iterable[Tuple[int, int, Number]], assign: bool = False) -> None:
+        """
+        Applies ``range_add`` (or ``range_assign`` when ``assign`` is True) for every
+        (lo, hi, value) triple, in order.
+        """
+        update = self.range_assign if assign else self.range_add
+        for lo, hi, value in updates:
+            update(lo, hi, value)
@@ -0,0 +1,57 @@
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from AVLTree import AVLTree
+from BST import CompleteTree, Tree
+
+
+def build_time(factory: Callable[[], Tree], keys: List[int]) -> float:
+    """Return the seconds needed to insert every key into a fresh tree."""
+    start = time.perf_counter()
+    tree = factory()
+    for key in keys:
+        tree.insert(key)
+    return time.perf_counter() - start
+
+
+def bench_build(sizes=(1_000, 5_000, 10_000, 100_000)) -> None:
+    """Compare building a ``Tree`` by breadth-first search with the array-backed ``CompleteTree``.
+
+    ``Tree`` is skipped above 10k keys, where its O(n) insert makes the build quadratic.
+    """
+    print(f"{'n':>8}{'Tree s':>12}{'CompleteTree s':>16}")
+    for n in sizes:
+        keys = [random.randrange(n) for _ in range(n)]
+        tree = f"{build_time(Tree, keys):>12.3f}" if n <= 10_000 else f"{'-':>12}"
+        print(f"{n:>8}{tree}{build_time(CompleteTree, keys):>16.3f}")
+
+
+def bench_memory(n: int = 1_000_000) -> None:
+    """Report bytes per key of the node-based trees, not counting the keys themselves."""
+    keys = list(range(n))
+    print(f"{'tree':<16}{'bytes/elem':>12}{'build s':>10}")
+    for factory in (CompleteTree, AVLTree):
+        tracemalloc.start()
+        start = time.perf_counter()
+        tree = factory()
+        for key in keys:
+            tree.insert(key)
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tree
+        print(f"{factory.__name__:<16}{current / n:>12.1f}{elapsed:>10.3f}")
+
+
+def main():
+    """
+    Runs the tree benchmarks.
+    """
+    bench_build()
+    bench_memory()
+
+
+if __name__ == "__main__":
+    main()